@@ -1,13 +1,78 @@
+import hashlib
 import logging
+from typing import Any, AsyncIterator, Callable, Optional
+
 from fastapi_cache import FastAPICache
 from fastapi_cache.backends.redis import RedisBackend
 from fastapi_cache.backends.inmemory import InMemoryBackend
+from redis import Redis
 from redis import asyncio as aioredis
+from sqlalchemy.orm import Session
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Shared async Redis client, set once init_cache connects; None means in-memory only
+redis_client: Optional[aioredis.Redis] = None
+# Blocking twin on the same server, for sync services running in the threadpool
+sync_redis_client: Optional[Redis] = None
+
+ANALYTICS_NAMESPACE = "analytics"
+
+
+def get_redis() -> Optional[aioredis.Redis]:
+    return redis_client
+
+
+def get_sync_redis() -> Optional[Redis]:
+    return sync_redis_client
+
+
+def request_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request: Any = None,
+    response: Any = None,
+    args: tuple = (),
+    kwargs: Optional[dict] = None,
+) -> str:
+    """
+    Cache key from the endpoint and its arguments, minus DB sessions.
+
+    The default builder hashes every kwarg, and the per-request Session's repr
+    carries its memory address, so its keys never repeat. Pass this as
+    ``@cache(key_builder=...)`` on endpoints whose writes clear their
+    namespace (see ``invalidate_analytics``).
+    """
+    kwargs = {
+        name: value
+        for name, value in (kwargs or {}).items()
+        if not isinstance(value, Session)
+    }
+    cache_key = hashlib.md5(
+        f"{func.__module__}:{func.__name__}:{args}:{sorted(kwargs.items())}".encode()
+    ).hexdigest()
+    return f"{namespace}:{cache_key}"
+
+
+async def invalidate_analytics() -> None:
+    """Drop the cached /analytics/all response after a counted write."""
+    try:
+        await FastAPICache.clear(namespace=ANALYTICS_NAMESPACE)
+    except Exception as e:
+        logger.warning(f"Failed to clear analytics cache: {e}")
+
+
+async def invalidate_analytics_on_write() -> AsyncIterator[None]:
+    """Route dependency: clear the analytics cache once the write succeeded."""
+    yield
+    await invalidate_analytics()
+
+
 async def init_cache():
+    global redis_client, sync_redis_client
+
     try:
         redis = aioredis.from_url(
             str(settings.DB_REDIS_URI),
@@ -21,6 +86,13 @@ async def init_cache():
         await redis.ping()
         
         FastAPICache.init(RedisBackend(redis), prefix="fastapi-cache")
+        redis_client = redis
+        sync_redis_client = Redis.from_url(
+            str(settings.DB_REDIS_URI),
+            decode_responses=False,
+            socket_connect_timeout=5,
+            socket_timeout=5,
+        )
         logger.info("Successfully connected to Redis cache.")
     except Exception as e:
         logger.warning(f"Failed to connect to Redis cache: {e}. Falling back to in-memory cache.")
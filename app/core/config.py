@@ -1,6 +1,6 @@
 from functools import lru_cache
 from os import getenv
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import Field, RedisDsn, computed_field, field_validator
 from pydantic_settings import BaseSettings
@@ -30,6 +30,13 @@ class Settings(BaseSettings):
     DB_USERNAME: str
     DB_PASSWORD: str
     DB_REDIS_URI: RedisDsn
+    # Connection budget shared by all gunicorn workers (keep under Postgres'
+    # max_connections); each worker's pool gets an equal slice of it unless
+    # DB_POOL_SIZE / DB_MAX_OVERFLOW are set explicitly
+    DB_MAX_CONNECTIONS: int = 80
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: Optional[int] = None
+    DB_POOL_RECYCLE: int = 3600
 
     # Payment Gateway
     EASYKASH_PRIVATE_KEY: str
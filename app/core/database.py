@@ -1,3 +1,6 @@
+import multiprocessing
+import os
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
@@ -10,10 +13,36 @@ db_url = settings.DATABASE_URL
 if db_url and db_url.startswith("postgres://"):
     db_url = db_url.replace("postgres://", "postgresql://", 1)
 
+# Pools are per process: split DB_MAX_CONNECTIONS across the gunicorn workers
+# (same worker count formula as gunicorn.conf.py; `main.py prod` exports
+# GUNICORN_WORKERS for its --workers) so the whole deployment stays within the
+# server's max_connections
+_workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+_per_worker = max(2, settings.DB_MAX_CONNECTIONS // max(1, _workers))
+if settings.DB_POOL_SIZE is not None:
+    _pool_size = settings.DB_POOL_SIZE
+else:
+    _pool_size = max(1, _per_worker * 2 // 3)
+if settings.DB_MAX_OVERFLOW is not None:
+    _max_overflow = settings.DB_MAX_OVERFLOW
+else:
+    _max_overflow = max(0, _per_worker - _pool_size)
+
 # إنشاء المحرك باستخدام الرابط المعدل
-engine = create_engine(db_url, echo=settings.DEBUG, pool_pre_ping=True)
+engine = create_engine(
+    db_url,
+    echo=settings.DEBUG,
+    pool_size=_pool_size,
+    max_overflow=_max_overflow,
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+)
 # Session
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: objects keep the values just written, so services
+# don't need a refresh() round trip after every commit
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 
 # Base Model
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import requests
@@ -14,6 +15,9 @@ TELEGRAM_API_URL = "https://api.telegram.org/bot{token}/{method}"
 class TelegramBot:
     def __init__(self, token: str):
         self.token = token
+        # One pooled session, so a broadcast to several admins reuses the
+        # same TLS connection instead of handshaking once per message
+        self.http = requests.Session()
 
     def send_message(
         self,
@@ -47,7 +51,7 @@ class TelegramBot:
         }
 
         try:
-            response = requests.post(url, json=payload, timeout=10)
+            response = self.http.post(url, json=payload, timeout=10)
             if response.status_code == 200:
                 logger.info(f"Message sent successfully to chat_id: {chat_id}")
                 return True
@@ -65,7 +69,7 @@ class TelegramBot:
 
         url = TELEGRAM_API_URL.format(token=self.token, method="getMe")
         try:
-            response = requests.get(url, timeout=10)
+            response = self.http.get(url, timeout=10)
             if response.status_code == 200:
                 return response.json()
             return None
@@ -105,12 +109,24 @@ def notify_admins(
 
     results = {}
     success_count = 0
+    admin_ids = list(dict.fromkeys(settings.TELEGRAM_ADMIN_IDS))
+
+    # Send to every admin at once so the total wait is the slowest send,
+    # not the sum of all of them
+    with ThreadPoolExecutor(max_workers=len(admin_ids)) as pool:
+        futures = {
+            admin_id: pool.submit(
+                telegram_bot.send_message,
+                chat_id=admin_id,
+                text=message,
+                parse_mode=parse_mode,
+            )
+            for admin_id in admin_ids
+        }
 
-    for admin_id in settings.TELEGRAM_ADMIN_IDS:
+    for admin_id, future in futures.items():
         try:
-            success = telegram_bot.send_message(
-                chat_id=admin_id, text=message, parse_mode=parse_mode
-            )
+            success = future.result()
             results[admin_id] = "success" if success else "failed"
             if success:
                 success_count += 1
@@ -10,11 +10,14 @@ user_course_subscriptions = Table(
     Column(
         "user_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
     ),
+    # The (user_id, course_id) primary key serves per-user lookups; this one
+    # serves Course.subscribers
     Column(
         "course_id",
         Integer,
         ForeignKey("courses.id", ondelete="CASCADE"),
         primary_key=True,
+        index=True,
     ),
     Column(
         "subscribed_at",
@@ -34,8 +37,14 @@ coupon_user_usage = Table(
         ForeignKey("coupons.id", ondelete="CASCADE"),
         primary_key=True,
     ),
+    # Second column of the (coupon_id, user_id) primary key: User.used_coupons
+    # needs its own index
     Column(
-        "user_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+        "user_id",
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
     ),
     Column(
         "used_at",
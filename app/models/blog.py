@@ -2,8 +2,9 @@
 from datetime import datetime, timezone
 from typing import List
 
-from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy import DateTime, Index, Integer, String, Text
 from sqlalchemy.dialects.mysql import JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -14,6 +15,18 @@ class Blog(Base):
     """Blog model for storing blog posts with structured content blocks"""
 
     __tablename__ = "blogs"
+    # GIN index so get_blogs_by_tag's tags @> '["x"]' is an index probe
+    __table_args__ = (
+        Index(
+            "blog_tags_gin",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ),
+    )
+    # blog_title_trgm / blog_subject_trgm (pg_trgm GIN on lower(title) and
+    # lower(subject), for search_blogs) live only in the migrations: create_all
+    # cannot assume the pg_trgm extension is installed.
 
     # Primary key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -30,8 +43,8 @@ class Blog(Base):
     # Content blocks: [{"type": "text", "content": "..."}, {"type": "image", "url": "...", "alt": "..."}]
     content: Mapped[List[dict]] = mapped_column(JSON, nullable=False, default=list)
 
-    # Tags/topics
-    tags: Mapped[List[str]] = mapped_column(JSON, nullable=False, default=list)
+    # Tags/topics (JSONB: containment queries and the GIN index need it)
+    tags: Mapped[List[str]] = mapped_column(JSONB, nullable=False, default=list)
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
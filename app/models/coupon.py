@@ -10,6 +10,9 @@ from app.core.database import Base
 
 class Coupon(Base):
     __tablename__ = "coupons"
+    # Fetch server-side updated_at via UPDATE ... RETURNING instead of a
+    # follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     # Primary key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -87,6 +87,7 @@ class Course(Base):
         "CourseContent",
         back_populates="course",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         lazy="select",
     )
 
@@ -11,6 +11,9 @@ from app.core.database import Base
 
 class DiveCenter(Base):
     __tablename__ = "dive_centers"
+    # Fetch server-side updated_at via UPDATE ... RETURNING instead of a
+    # follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, Integer, String, Text
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, text
 from sqlalchemy.sql import func
 
 from app.core.database import Base
@@ -8,10 +8,17 @@ class Gallery(Base):
     """Gallery model for storing image metadata"""
 
     __tablename__ = "gallery"
+    # Newest-first listing and its keyset cursor walk this index
+    __table_args__ = (
+        Index("gallery_created_at_id_desc", text("created_at DESC"), text("id DESC")),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     name = Column(String(255), nullable=False, index=True)
     url = Column(Text, nullable=False)
+    # S3 object key behind url; NULL only for legacy rows whose url could not
+    # be mapped back to a key
+    object_key = Column(String(255), nullable=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     def __repr__(self):
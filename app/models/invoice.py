@@ -33,7 +33,9 @@ class Invoice(Base):
     payment_method: Mapped[str] = mapped_column(
         String(50), default="easykash", nullable=False
     )
-    status: Mapped[str] = mapped_column(String(50), default="PENDING", nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(50), default="PENDING", nullable=False, index=True
+    )
 
     # --- CORRECTIONS HERE ---
     customer_reference: Mapped[str] = mapped_column(
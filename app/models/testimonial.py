@@ -1,7 +1,17 @@
 # app/models/testimonial.py
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, func, text
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    func,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -9,6 +19,13 @@ from app.core.database import Base
 
 class Testimonial(Base):
     __tablename__ = "testimonials"
+    __table_args__ = (
+        Index(
+            "ix_testimonials_accepted",
+            "id",
+            postgresql_where=text("is_accepted = true"),
+        ),
+    )
 
     # Primary key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -2,7 +2,7 @@
 from datetime import datetime
 from typing import List
 
-from sqlalchemy import Boolean, DateTime, Integer, String, func, text
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -10,6 +10,19 @@ from app.core.database import Base
 
 class User(Base):
     __tablename__ = "users"
+    # Partial indexes so the analytics status counts stay index-only
+    __table_args__ = (
+        Index("ix_users_active", "id", postgresql_where=text("is_active = true")),
+        Index("ix_users_blocked", "id", postgresql_where=text("is_blocked = true")),
+        # Newest-first index for the admin "recent users" list
+        Index("users_created_at_desc", text("created_at DESC")),
+        # users_fullname_trgm / users_email_trgm (pg_trgm GIN, for the ILIKE
+        # search in get_all_users) live only in the migrations: create_all
+        # cannot assume the pg_trgm extension is installed.
+    )
+    # Fetch server-side updated_at via UPDATE ... RETURNING instead of a
+    # follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     # Primary key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
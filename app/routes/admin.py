@@ -37,10 +37,15 @@ async def get_all_users(
     email: str = Query(
         None, description="Filter by email (case-insensitive partial match)"
     ),
+    cursor: int = Query(
+        None,
+        ge=0,
+        description="Keyset cursor: return users after this id (0 for the first page). Skips totals.",
+    ),
     db: Session = Depends(get_db),
 ):
     return AdminServices(db).get_all_users(
-        page=page, page_size=page_size, name=name, email=email
+        page=page, page_size=page_size, name=name, email=email, cursor=cursor
     )
 
 
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, Path
 from fastapi_cache.decorator import cache
 from sqlalchemy.orm import Session
 
+from app.core.cache import ANALYTICS_NAMESPACE, request_key_builder
 from app.core.dependencies import get_current_admin, get_db
 from app.models.user import User
 from app.schemas.user import *
@@ -15,6 +16,7 @@ analytics_routes = APIRouter(
 
 
 @analytics_routes.get("/all")
+@cache(expire=30, namespace=ANALYTICS_NAMESPACE, key_builder=request_key_builder)
 async def get_all_users(db: Session = Depends(get_db)):
     return AnalyticsServices(db).get_all()
 
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, status
 from sqlalchemy.orm import Session
 
+from app.core.cache import invalidate_analytics_on_write
 from app.core.dependencies import get_current_super_admin, get_current_user, get_db
 from app.core.limiter import limiter
 from app.models.user import User
@@ -13,18 +14,25 @@ auth_routes = APIRouter(
 )
 
 
-@auth_routes.post("/register", status_code=status.HTTP_201_CREATED)
+@auth_routes.post(
+    "/register",
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(invalidate_analytics_on_write)],
+)
 @limiter.limit("3/minute")
 async def create_new_user(
-    request: Request, user: UserCreate, db: Session = Depends(get_db)
+    request: Request,
+    user: UserCreate,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
 ):
-    return AuthServices(db).create_new_user(user)
+    return await AuthServices(db).create_new_user(user, background_tasks)
 
 
 @auth_routes.post("/login")
 @limiter.limit("3/minute")
 async def user_login(request: Request, user: UserLogin, db: Session = Depends(get_db)):
-    return AuthServices(db).user_login(user)
+    return await AuthServices(db).user_login(user)
 
 
 @auth_routes.get("/logout")
@@ -45,15 +53,18 @@ async def user_logout(
 async def create_new_admin(
     request: Request, admin: AdminCreate, db: Session = Depends(get_db)
 ):
-    return AuthServices(db).create_new_admin(admin)
+    return await AuthServices(db).create_new_admin(admin)
 
 
 @auth_routes.post("/admin/login")
 @limiter.limit("3/minute")
 async def admin_login(
-    request: Request, admin: AdminLogin, db: Session = Depends(get_db)
+    request: Request,
+    admin: AdminLogin,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
 ):
-    return AuthServices(db).admin_login(admin)
+    return await AuthServices(db).admin_login(admin, background_tasks)
 
 
 @auth_routes.get("/verify")
@@ -19,10 +19,13 @@ blog_routes = APIRouter(prefix="/blogs", tags=["Blog Endpoints"])
 async def get_all_blogs(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[int] = Query(
+        None, ge=1, description="Return blogs with id below this (newest first)"
+    ),
     db: Session = Depends(get_db),
 ):
     """Get all blog posts (without full text for performance)"""
-    return BlogService(db).get_all_blogs(skip=skip, limit=limit)
+    return BlogService(db).get_all_blogs(skip=skip, limit=limit, cursor=cursor)
 
 
 @blog_routes.get("/id/{blog_id}", response_model=BlogResponse)
@@ -45,10 +48,15 @@ async def get_blogs_by_tag(
     tag: str,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[int] = Query(
+        None, ge=1, description="Return blogs with id below this (newest first)"
+    ),
     db: Session = Depends(get_db),
 ):
     """Get all blog posts with a specific tag"""
-    return BlogService(db).get_blogs_by_tag(tag, skip=skip, limit=limit)
+    return BlogService(db).get_blogs_by_tag(
+        tag, skip=skip, limit=limit, cursor=cursor
+    )
 
 
 @blog_routes.get("/search/", response_model=List[BlogListResponse])
@@ -57,10 +65,13 @@ async def search_blogs(
     q: str = Query(..., min_length=1),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[int] = Query(
+        None, ge=1, description="Return blogs with id below this (newest first)"
+    ),
     db: Session = Depends(get_db),
 ):
     """Search blogs by title, subject, or content"""
-    return BlogService(db).search_blogs(q, skip=skip, limit=limit)
+    return BlogService(db).search_blogs(q, skip=skip, limit=limit, cursor=cursor)
 
 
 @blog_routes.get("/tags/all", response_model=List[str])
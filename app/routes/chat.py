@@ -1,5 +1,4 @@
 import asyncio
-import json
 import logging
 from datetime import datetime, timezone
 from typing import Optional
@@ -20,6 +19,7 @@ from app.schemas.chat import (
     ChatSessionResponse,
 )
 from app.services.ai_client import run_chat_turn
+from app.utils.json_encoder import sse_event
 
 logger = logging.getLogger(__name__)
 
@@ -177,13 +177,13 @@ async def chat_message_stream(
     session_id_val = session.id
 
     async def event_stream():
-        yield f"data: {json.dumps({'type': 'session_id', 'session_id': session_id_val})}\n\n"
+        yield sse_event({"type": "session_id", "session_id": session_id_val})
         words = reply.split(" ")
         for i, word in enumerate(words):
             chunk = word + (" " if i < len(words) - 1 else "")
-            yield f"data: {json.dumps({'type': 'chunk', 'text': chunk})}\n\n"
+            yield sse_event({"type": "chunk", "text": chunk})
             await asyncio.sleep(0.02)
-        yield f"data: {json.dumps({'type': 'done'})}\n\n"
+        yield sse_event({"type": "done"})
 
     return StreamingResponse(
         event_stream(),
@@ -170,8 +170,9 @@ async def complete(request: CompleteRequest):
     description="""
     Retrieve the full conversation history for a given session.
     
-    Returns all messages (user and assistant) stored in memory for the session.
-    Note: Sessions are stored in-memory and will be lost on server restart.
+    Returns all messages (user and assistant) stored for the session.
+    Note: Sessions are kept in Redis for 24 hours of inactivity; without Redis
+    they are stored in-memory and will be lost on server restart.
     """
 )
 async def get_conversation(session_id: str):
@@ -181,7 +182,7 @@ async def get_conversation(session_id: str):
     Returns all messages in chronological order with timestamps.
     """
     try:
-        history = get_conversation_history(session_id)
+        history = await get_conversation_history(session_id)
         
         if not history:
             # Return empty conversation rather than 404
@@ -1,5 +1,5 @@
 # app/routes/coupon.py
-from typing import List
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Path, Query
 from sqlalchemy.orm import Session
@@ -35,12 +35,15 @@ async def create_coupon(
 async def get_all_coupons(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[int] = Query(
+        None, ge=1, description="Return coupons with id below this (newest first)"
+    ),
     db: Session = Depends(get_db),
 ):
     """
     Get all coupons with pagination.
     """
-    return CouponServices(db).get_all_coupons(skip=skip, limit=limit)
+    return CouponServices(db).get_all_coupons(skip=skip, limit=limit, cursor=cursor)
 
 
 @coupon_routes.get("/{coupon_id}", response_model=CouponResponse)
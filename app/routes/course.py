@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, File, Form, Path, UploadFile
+from fastapi import APIRouter, Depends, File, Form, Path, Query, UploadFile
 from fastapi_cache.decorator import cache
 from sqlalchemy.orm import Session
 
@@ -23,16 +23,24 @@ course_routes = APIRouter(prefix="/courses", tags=["Course Endpoints"])
 
 @course_routes.get("/", response_model=list[CourseResponse])
 @cache(expire=600)
-async def get_all_courses(db: Session = Depends(get_db)):
-    return CourseServices(db).get_all_courses()
+async def get_all_courses(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+):
+    return CourseServices(db).get_all_courses(skip=skip, limit=limit)
 
 
 @course_routes.get(
     "/content",
     response_model=list[SubscribedCourseResponse],
 )
-async def get_all_courses_with_contents(db: Session = Depends(get_db)):
-    return CourseServices(db).get_all_courses_with_contents()
+async def get_all_courses_with_contents(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+):
+    return CourseServices(db).get_all_courses_with_contents(skip=skip, limit=limit)
 
 
 @course_routes.get("/{id}", response_model=CourseResponse)
@@ -1,7 +1,9 @@
 import json
 from typing import List
 
-from fastapi import APIRouter, Depends, File, Form, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, Query, UploadFile, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
@@ -49,24 +51,32 @@ async def create_dive_center(
         except Exception:
             coords = None
 
-    data = DiveCenterCreate(
-        name=name,
-        description=description,
-        location=location,
-        hotel_name=hotel_name,
-        phone=phone,
-        email=email,
-        working_hours=wh,
-        coordinates=coords,
-    )
+    try:
+        data = DiveCenterCreate(
+            name=name,
+            description=description,
+            location=location,
+            hotel_name=hotel_name,
+            phone=phone,
+            email=email,
+            working_hours=wh,
+            coordinates=coords,
+        )
+    except ValidationError as e:
+        # Form fields are validated here, not by FastAPI; answer 422, not 500
+        raise RequestValidationError(e.errors(include_url=False, include_context=False))
     return await DiveCenterService(db).create_dive_center(
         data, image_files=images, video_file=video
     )
 
 
 @dive_center_routes.get("/", response_model=List[DiveCenterResponse])
-def get_all_dive_centers(db: Session = Depends(get_db)):
-    return DiveCenterService(db).get_all_dive_centers()
+def get_all_dive_centers(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+):
+    return DiveCenterService(db).get_all_dive_centers(skip=skip, limit=limit)
 
 
 @dive_center_routes.get("/{dive_center_id}", response_model=DiveCenterResponse)
@@ -113,7 +123,10 @@ async def update_dive_center(
     }
     # only keep fields actually sent, so we don't null out untouched columns
     provided = {k: v for k, v in raw.items() if v is not None}
-    data = DiveCenterUpdate(**provided)
+    try:
+        data = DiveCenterUpdate(**provided)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False, include_context=False))
 
     return await DiveCenterService(db).update_dive_center(
         dive_center_id,
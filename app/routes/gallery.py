@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from sqlalchemy.orm import Session
@@ -34,6 +34,9 @@ async def upload_image(file: UploadFile = File(...), db: Session = Depends(get_d
 def get_all_images(
     skip: int = Query(0, ge=0, description="Number of images to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of images to return"),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page (newest first)"
+    ),
     db: Session = Depends(get_db),
 ):
     """
@@ -41,9 +44,14 @@ def get_all_images(
 
     - **skip**: Number of images to skip (default: 0)
     - **limit**: Maximum number of images to return (default: 100, max: 1000)
+    - **cursor**: ``next_cursor`` of the previous page; keyset page, skip is ignored
     """
-    images, total = image_service.get_images(db, skip=skip, limit=limit)
-    return ImageListResponse(images=images, total=total, skip=skip, limit=limit)
+    images, total, next_cursor = image_service.get_images(
+        db, skip=skip, limit=limit, cursor=cursor
+    )
+    return ImageListResponse(
+        images=images, total=total, skip=skip, limit=limit, next_cursor=next_cursor
+    )
 
 
 @gallery_routes.get("/{image_id}", response_model=ImageResponse)
@@ -1,9 +1,11 @@
+import json
 from typing import List
 
 from dotenv import load_dotenv
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 
+from app.core.cache import invalidate_analytics_on_write
 from app.core.database import get_db
 from app.core.dependencies import get_current_super_admin, get_current_user
 from app.models.admin import Admin
@@ -12,6 +14,8 @@ from app.models.user import User
 # --- IMPORT NEW AND UPDATED SCHEMAS ---
 from app.schemas.invoice import UserInvoiceSummaryResponse  # <-- NEW
 from app.schemas.invoice import (
+    INVOICE_STATUSES,
+    EasyKashCallbackPayload,
     InvoiceCreate,
     InvoiceCreateResponse,
     InvoiceDetailedSummaryResponse,
@@ -20,9 +24,10 @@ from app.schemas.invoice import (
     InvoiceUpdate,
     MonthlyInvoiceAnalytics,
     TopCustomerResponse,
+    encode_invoice_summary,
 )
 from app.services.invoice import InvoiceService
-from app.utils.easykash import easykash_client, secret_key
+from app.utils.easykash import SIGNATURE_FIELDS, easykash_client, secret_key
 
 router = APIRouter(prefix="/invoices", tags=["Invoices"])
 
@@ -32,6 +37,7 @@ router = APIRouter(prefix="/invoices", tags=["Invoices"])
     status_code=status.HTTP_201_CREATED,
     response_model=InvoiceCreateResponse,
     summary="Create a new invoice and payment link",
+    dependencies=[Depends(invalidate_analytics_on_write)],
 )
 def create_new_invoice(
     invoice_data: InvoiceCreate,
@@ -82,7 +88,7 @@ def get_invoice_details(
     current_user: User = Depends(get_current_user),
 ):
     invoice = InvoiceService.get_invoice(db, invoice_id, current_user.id)
-    return invoice
+    return InvoiceResponse.model_validate(invoice).to_response()
 
 
 @router.get(
@@ -98,7 +104,8 @@ def get_last_invoice_for_current_user(
     Retrieves the most recently created invoice for the currently authenticated user.
     Ideal for redirecting a user to check the status immediately after a booking.
     """
-    return InvoiceService.get_last_invoice_for_user(db=db, user_id=current_user.id)
+    invoice = InvoiceService.get_last_invoice_for_user(db=db, user_id=current_user.id)
+    return InvoiceResponse.model_validate(invoice).to_response()
 
 
 @router.get(
@@ -115,9 +122,10 @@ def get_invoice_by_reference(
     Retrieves details for a specific invoice using its `customerReference`.
     **Security**: This endpoint ensures that a user can only access their own invoice.
     """
-    return InvoiceService.get_invoice_by_reference_for_user(
+    invoice = InvoiceService.get_invoice_by_reference_for_user(
         db=db, customer_reference=customer_reference, user_id=current_user.id
     )
+    return InvoiceResponse.model_validate(invoice).to_response()
 
 
 # --- Public Fast Check Endpoint (No Auth Required) ---
@@ -136,15 +144,17 @@ def fast_check_invoice_status(
     Public endpoint to check invoice status using the reference number.
     No authentication required. The obscure URL provides security through obscurity.
     """
-    return InvoiceService.get_invoice_by_reference_public(
+    invoice = InvoiceService.get_invoice_by_reference_public(
         db=db, customer_reference=ref_number
     )
+    return InvoiceResponse.model_validate(invoice).to_response()
 
 
 @router.put(
     "/m7x4w9h2t6n8v3qp5r1k/fast-pickup",
     response_model=InvoiceResponse,
     summary="Fast update pickup status (Public)",
+    dependencies=[Depends(invalidate_analytics_on_write)],
 )
 def fast_update_pickup_status(
     ref_number: str,
@@ -164,6 +174,7 @@ def fast_update_pickup_status(
     "/p8k5m2x9w4q7n3v6r1t/fast-pay",
     response_model=InvoiceResponse,
     summary="Fast update payment status (Public)",
+    dependencies=[Depends(invalidate_analytics_on_write)],
 )
 def fast_update_payment_status(
     ref_number: str,
@@ -175,12 +186,11 @@ def fast_update_payment_status(
     Allowed statuses: PAID, PENDING, CANCELLED, EXPIRED, FAILED
     No authentication required. The obscure URL provides security through obscurity.
     """
-    # Validate status
-    allowed_statuses = ["PAID", "PENDING", "CANCELLED", "EXPIRED", "FAILED"]
-    if status.upper() not in allowed_statuses:
+    # Validate status (the `status` param shadows fastapi.status here)
+    if status.upper() not in INVOICE_STATUSES:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid status. Allowed: {', '.join(allowed_statuses)}",
+            status_code=400,
+            detail=f"Invalid status. Allowed: {', '.join(INVOICE_STATUSES)}",
         )
 
     return InvoiceService.update_payment_status_public(
@@ -204,7 +214,8 @@ def get_invoices_summary_for_admin(db: Session = Depends(get_db)):
     Provides a summary of all invoices in the system, including total revenue
     and counts by status. Requires super admin privileges.
     """
-    return InvoiceService.get_invoices_summary_for_admin(db=db)
+    summary = InvoiceService.get_invoices_summary_for_admin(db=db)
+    return Response(encode_invoice_summary(summary), media_type="application/json")
 
 
 @router.get(
@@ -327,7 +338,10 @@ def get_all_invoices_for_admin(
     "/admin/{invoice_id}",
     response_model=InvoiceResponse,
     summary="Update an invoice (Admin Only)",
-    dependencies=[Depends(get_current_super_admin)],
+    dependencies=[
+        Depends(get_current_super_admin),
+        Depends(invalidate_analytics_on_write),
+    ],
 )
 def update_invoice_for_admin(
     invoice_id: int,
@@ -347,7 +361,10 @@ def update_invoice_for_admin(
     "/admin/{invoice_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete an invoice (Admin Only)",
-    dependencies=[Depends(get_current_super_admin)],
+    dependencies=[
+        Depends(get_current_super_admin),
+        Depends(invalidate_analytics_on_write),
+    ],
 )
 def delete_invoice_for_admin(
     invoice_id: int,
@@ -363,7 +380,10 @@ def delete_invoice_for_admin(
 @router.get(
     "/invoice/picked-up",
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(get_current_super_admin)],
+    dependencies=[
+        Depends(get_current_super_admin),
+        Depends(invalidate_analytics_on_write),
+    ],
 )
 def update_invoice_picked_up_status(
     invoice_id: int,
@@ -387,17 +407,32 @@ def handle_easykash_webhook():
         return {"message": "Example callback verification failed"}
 
 
-@router.post("/webhook/easykash-callback", status_code=status.HTTP_200_OK)
-async def easykash_callback_handler(payload: dict, db: Session = Depends(get_db)):
+@router.post(
+    "/webhook/easykash-callback",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidate_analytics_on_write)],
+)
+async def easykash_callback_handler(request: Request, db: Session = Depends(get_db)):
     """
     Receives, verifies, and processes payment callbacks from EasyKash.
     """
+    try:
+        data = json.loads(await request.body())
+    except ValueError:
+        data = None
+    if not isinstance(data, dict) or any(
+        field not in data for field in (*SIGNATURE_FIELDS, "signatureHash")
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Malformed callback payload.",
+        )
 
     # --- Step 1: Verify signature ---
-    is_signature_valid = easykash_client.verify_callback(payload, secret_key)
+    is_signature_valid = easykash_client.verify_callback(data, secret_key)
     if not is_signature_valid:
         print(
-            f"WARNING: Invalid signature received for customer reference '{payload.get('customerReference')}'."
+            f"WARNING: Invalid signature received for customer reference '{data.get('customerReference')}'."
         )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -405,9 +440,12 @@ async def easykash_callback_handler(payload: dict, db: Session = Depends(get_db)
         )
 
     print(
-        f"Signature verified successfully for customer reference: {payload.get('customerReference')}"
+        f"Signature verified successfully for customer reference: {data.get('customerReference')}"
     )
 
+    # The signature vouches for the payload, so skip re-validating it
+    payload = EasyKashCallbackPayload.model_construct(**data)
+
     # --- Step 2: Business logic ---
     try:
         result = InvoiceService.process_payment_callback(db=db, payload=payload)
@@ -417,7 +455,7 @@ async def easykash_callback_handler(payload: dict, db: Session = Depends(get_db)
     except Exception as e:
         db.rollback()
         print(
-            f"ERROR: Unexpected error while processing payment for ref '{payload.get('customerReference')}': {e}"
+            f"ERROR: Unexpected error while processing payment for ref '{payload.customerReference}': {e}"
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
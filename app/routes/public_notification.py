@@ -50,7 +50,9 @@ async def get_notification_by_id(
     """
     Get a specific public notification by ID.
     """
-    return PublicNotificationServices(db).get_notification_by_id(notification_id)
+    return PublicNotificationServices(db).get_notification_by_id(
+        notification_id
+    ).to_response()
 
 
 @public_notification_routes.put(
@@ -14,7 +14,7 @@ setting_routes = APIRouter(
 
 @setting_routes.get("/", response_model=WebsiteSettingsResponse)
 async def get_settings(db: Session = Depends(get_db)):
-    return WebsiteSettingsService(db).get_settings()
+    return WebsiteSettingsService(db).get_settings().to_response()
 
 
 @setting_routes.put(
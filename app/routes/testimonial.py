@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, Path
 from fastapi_cache.decorator import cache
 from sqlalchemy.orm import Session
 
+from app.core.cache import invalidate_analytics_on_write
 from app.core.database import get_db
 from app.core.dependencies import get_current_admin, get_current_user
 from app.models.user import User
@@ -11,7 +12,9 @@ from app.services.testimonial import TestimonialServices
 testimonial_routes = APIRouter(prefix="/testimonials", tags=["Testimonial Endpoints"])
 
 
-@testimonial_routes.post("/create")
+@testimonial_routes.post(
+    "/create", dependencies=[Depends(invalidate_analytics_on_write)]
+)
 async def create_testimonial(
     testimonial: CreateTestimonial,
     db: Session = Depends(get_db),
@@ -33,11 +36,23 @@ async def get_testimonial_by_id(
     return TestimonialServices(db).get_testimonial_by_id(id)
 
 
-@testimonial_routes.put("/{id}", dependencies=[Depends(get_current_admin)])
+@testimonial_routes.put(
+    "/{id}",
+    dependencies=[
+        Depends(get_current_admin),
+        Depends(invalidate_analytics_on_write),
+    ],
+)
 async def accept_testimonial(id: int = Path(..., ge=1), db: Session = Depends(get_db)):
     return TestimonialServices(db).accept_testimonial(id)
 
 
-@testimonial_routes.delete("/{id}", dependencies=[Depends(get_current_admin)])
+@testimonial_routes.delete(
+    "/{id}",
+    dependencies=[
+        Depends(get_current_admin),
+        Depends(invalidate_analytics_on_write),
+    ],
+)
 async def delete_testimonial(id: int = Path(..., ge=1), db: Session = Depends(get_db)):
     return TestimonialServices(db).delete_testimonial(id)
@@ -6,6 +6,13 @@ from typing import Optional
 from pydantic import BaseModel, Field, field_validator
 
 
+def _ensure_not_past(value: date, message: str) -> date:
+    """Shared check behind the future-date validators below"""
+    if value < date.today():
+        raise ValueError(message)
+    return value
+
+
 class ActivityAvailabilityBase(BaseModel):
     activity_type: str = Field(..., pattern="^(trip|course)$")
     activity_id: int = Field(..., gt=0)
@@ -16,9 +23,7 @@ class ActivityAvailabilityBase(BaseModel):
     @classmethod
     def validate_future_date(cls, v):
         """Ensure the date is not in the past"""
-        if v < date.today():
-            raise ValueError("Cannot close activity for past dates")
-        return v
+        return _ensure_not_past(v, "Cannot close activity for past dates")
 
 
 class ActivityAvailabilityCreate(ActivityAvailabilityBase):
@@ -37,9 +42,7 @@ class ActivityAvailabilityUpdate(BaseModel):
     @classmethod
     def validate_future_date(cls, v):
         """Ensure the date is not in the past"""
-        if v < date.today():
-            raise ValueError("Cannot update to a past date")
-        return v
+        return _ensure_not_past(v, "Cannot update to a past date")
 
 
 class ActivityAvailabilityResponse(ActivityAvailabilityBase):
@@ -1,12 +1,13 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
+from app.schemas.base import FastModel
 from app.schemas.user import UserResponse
 
 
-class AdminResponse(BaseModel):
+class AdminResponse(FastModel):
     id: int
     full_name: str
     username: str
@@ -16,10 +17,7 @@ class AdminResponse(BaseModel):
     role: str
     admin_level: int
     is_active: bool
-    last_login: str
-
-    class Config:
-        form_attributes = True
+    last_login: Optional[str] = None
 
 
 class AdminUpdate(BaseModel):
@@ -37,14 +35,16 @@ class AdminUpdatePassword(BaseModel):
 
 class PaginatedUsersResponse(BaseModel):
     users: List[UserResponse]
-    total: int
+    # Totals are skipped on cursor requests
+    total: Optional[int] = None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
     has_next: bool
     has_previous: bool
     next_page: Optional[int] = None
     previous_page: Optional[int] = None
+    next_cursor: Optional[int] = None
 
 
 class PasswordUpdate(BaseModel):
@@ -54,3 +54,6 @@ class PasswordUpdate(BaseModel):
 class AdminEnrollmentRequest(BaseModel):
     user_id: int
     course_id: int
+
+
+ADMIN_LIST_ADAPTER = TypeAdapter(List[AdminResponse])
@@ -0,0 +1,28 @@
+from fastapi import Response
+from pydantic import BaseModel, ConfigDict
+
+
+class DeferredModel(BaseModel):
+    """Schema base whose core schema is built on first use instead of at import."""
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class FastModel(DeferredModel):
+    """Response schema base that can serialize itself straight to a Response."""
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+        validate_default=False,
+        populate_by_name=True,
+        ser_json_timedelta="iso8601",
+    )
+
+    def to_response(self, status_code: int = 200) -> Response:
+        """Encode with pydantic-core, bypassing FastAPI's response re-validation."""
+        return Response(
+            self.model_dump_json(by_alias=True),
+            status_code=status_code,
+            media_type="application/json",
+        )
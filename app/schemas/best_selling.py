@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import Optional, Union
+from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from app.models.best_selling import ItemType
 from app.schemas.course import CourseResponse
@@ -46,6 +46,9 @@ class BestSellingResponse(BestSellingInDB):
         from_attributes = True
 
 
+BEST_SELLING_LIST_ADAPTER = TypeAdapter(List[BestSellingResponse])
+
+
 class BestSellingListResponse(BaseModel):
     items: list[BestSellingResponse]
     total: int
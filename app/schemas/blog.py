@@ -2,7 +2,7 @@
 from datetime import datetime
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class ContentBlock(BaseModel):
@@ -15,6 +15,9 @@ class ContentBlock(BaseModel):
     caption: Optional[str] = None  # Optional caption for images
 
 
+CONTENT_BLOCK_LIST_ADAPTER = TypeAdapter(List[ContentBlock])
+
+
 class BlogCreate(BaseModel):
     """Schema for creating a new blog post"""
 
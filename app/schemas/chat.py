@@ -1,12 +1,15 @@
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel
 
 
+MessageRole = Literal["user", "assistant"]
+
+
 class ChatMessageResponse(BaseModel):
     id: int
-    role: str
+    role: MessageRole
     content: str
     created_at: datetime
 
@@ -2,7 +2,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, computed_field
 
 
 class CouponCreate(BaseModel):
@@ -32,17 +32,34 @@ class CouponResponse(BaseModel):
     can_used_up_to: int
     user_limit: int
     used_count: int
-    remaining: int
-    can_used: bool
     is_active: bool
     expire_date: Optional[datetime]
     created_at: datetime
     updated_at: datetime
 
+    @computed_field
+    @property
+    def remaining(self) -> int:
+        """Remaining coupon usage count"""
+        return max(0, self.can_used_up_to - self.used_count)
+
+    @computed_field
+    @property
+    def can_used(self) -> bool:
+        """Whether the coupon can still be used"""
+        if not self.is_active or self.remaining <= 0:
+            return False
+        if self.expire_date and datetime.utcnow() > self.expire_date:
+            return False
+        return True
+
     class Config:
         from_attributes = True
 
 
+COUPON_LIST_ADAPTER = TypeAdapter(List[CouponResponse])
+
+
 class CouponDetailResponse(CouponResponse):
     users: List[dict] = []  # List of users who used the coupon
 
@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, EmailStr, Field, model_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, model_validator
 
 from app.utils.storage import get_public_url
 
@@ -17,6 +17,41 @@ class DayWorkingHours(BaseModel):
     is_open: bool
 
 
+def _open_day(start: str = "09:00", end: str = "17:00") -> DayWorkingHours:
+    return DayWorkingHours(start=start, end=end, is_open=True)
+
+
+class WeeklyHours(BaseModel):
+    """
+    Working hours keyed by weekday; stored in the DB as a dict keyed by day.
+
+    Days left out stay None (never filled in), so a partial update only
+    touches the days it sends. Unknown day keys are rejected.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    monday: Optional[DayWorkingHours] = None
+    tuesday: Optional[DayWorkingHours] = None
+    wednesday: Optional[DayWorkingHours] = None
+    thursday: Optional[DayWorkingHours] = None
+    friday: Optional[DayWorkingHours] = None
+    saturday: Optional[DayWorkingHours] = None
+    sunday: Optional[DayWorkingHours] = None
+
+
+def _default_week() -> WeeklyHours:
+    return WeeklyHours(
+        monday=_open_day(),
+        tuesday=_open_day(),
+        wednesday=_open_day(),
+        thursday=_open_day(),
+        friday=_open_day(),
+        saturday=_open_day("10:00", "14:00"),
+        sunday=DayWorkingHours(start="", end="", is_open=False),
+    )
+
+
 class DiveCenterBase(BaseModel):
     name: str = Field(..., max_length=100)
     description: Optional[str] = Field(None, max_length=10000)
@@ -28,17 +63,7 @@ class DiveCenterBase(BaseModel):
     phone: str = Field(..., max_length=30)
     email: EmailStr
     coordinates: Optional[Coordinates] = Field(default_factory=Coordinates)
-    working_hours: Optional[Dict[str, DayWorkingHours]] = Field(
-        default_factory=lambda: {
-            "monday": {"start": "09:00", "end": "17:00", "is_open": True},
-            "tuesday": {"start": "09:00", "end": "17:00", "is_open": True},
-            "wednesday": {"start": "09:00", "end": "17:00", "is_open": True},
-            "thursday": {"start": "09:00", "end": "17:00", "is_open": True},
-            "friday": {"start": "09:00", "end": "17:00", "is_open": True},
-            "saturday": {"start": "10:00", "end": "14:00", "is_open": True},
-            "sunday": {"start": "", "end": "", "is_open": False},
-        }
-    )
+    working_hours: Optional[WeeklyHours] = Field(default_factory=_default_week)
 
 
 class DiveCenterCreate(DiveCenterBase):
@@ -54,13 +79,14 @@ class DiveCenterUpdate(BaseModel):
     phone: Optional[str] = None
     email: Optional[EmailStr] = None
     coordinates: Optional[Coordinates] = None
-    working_hours: Optional[Dict[str, DayWorkingHours]] = None
+    working_hours: Optional[WeeklyHours] = None
     # images/video are handled separately via file uploads in the route,
     # not through this schema — keeps update semantics (append/replace) explicit.
 
 
 class DiveCenterResponse(DiveCenterBase):
     id: int
+    email: str  # validated on write, no need to re-check on read
     created_at: datetime
     updated_at: datetime
 
@@ -27,7 +27,6 @@ class ImageResponse(ImageBase):
     """Schema for image response"""
 
     id: int
-    url: str
     created_at: datetime
 
     class Config:
@@ -41,3 +40,4 @@ class ImageListResponse(BaseModel):
     total: int
     skip: int
     limit: int
+    next_cursor: Optional[str] = None  # pass as ``cursor`` for the next page
@@ -1,13 +1,20 @@
 # app/schemas/invoice.py
 
 from datetime import date, datetime
-from typing import Any, List, Optional
+from typing import List, Literal, Optional, get_args
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import ConfigDict, EmailStr, Field, with_config
+from typing_extensions import TypedDict
 
+from app.schemas.base import DeferredModel, FastModel
+
+InvoiceStatus = Literal["PENDING", "PAID", "FAILED", "CANCELLED", "EXPIRED"]
+InvoiceType = Literal["online", "cash"]
+
+INVOICE_STATUSES = get_args(InvoiceStatus)
 
 # --- NEW Activity Detail Schema ---
-class ActivityDetail(BaseModel):
+class ActivityDetail(DeferredModel):
     name: str = Field(
         ..., description="Name of the activity, e.g., 'Trip Booking: test'"
     )
@@ -29,8 +36,23 @@ class ActivityDetail(BaseModel):
     )
 
 
+@with_config(ConfigDict(extra="allow"))
+class StoredActivityDetail(TypedDict, total=False):
+    """Activity detail as stored on the invoice; older rows may carry extra keys."""
+
+    name: str
+    activity_date: str
+    adults: int
+    children: int
+    hotel_name: Optional[str]
+    room_number: Optional[str]
+    special_requests: Optional[str]
+    transfer_zone_id: Optional[int]
+    selected_optional_fee_ids: List[int]
+
+
 # --- Existing schemas ---
-class InvoiceBase(BaseModel):
+class InvoiceBase(DeferredModel):
     buyer_name: str
     buyer_email: str
     buyer_phone: str
@@ -44,7 +66,7 @@ class InvoiceBase(BaseModel):
         default=1.0,
         description="Conversion rate to EGP. For EGP invoices = 1.0, for others = EGP equivalent rate (e.g., 1 EUR = 47 EGP, so convert_rate = 47)",
     )
-    invoice_type: str = Field(
+    invoice_type: InvoiceType = Field(
         default="online", description="Type of invoice: 'online' or 'cash'"
     )
 
@@ -73,7 +95,7 @@ class InvoiceCreate(InvoiceBase):
     )
 
 
-class InvoiceCreateResponse(BaseModel):
+class InvoiceCreateResponse(DeferredModel):
     id: int
     user_id: int
     status: str
@@ -94,13 +116,13 @@ class InvoiceCreateResponse(BaseModel):
     )
 
 
-class InvoiceResponse(InvoiceBase):
+class InvoiceResponse(InvoiceBase, FastModel):
     id: int
     user_id: int
     status: str
     pay_url: Optional[str] = None
     activity: str
-    activity_details: Optional[List[Any]] = None
+    activity_details: Optional[List[StoredActivityDetail]] = None
     picked_up: Optional[bool] = Field(default=False)
     customer_reference: Optional[str] = None
     easykash_reference: Optional[str] = None
@@ -123,12 +145,9 @@ class InvoiceResponse(InvoiceBase):
     is_confirmed: bool = Field(default=False, description="Admin confirmation status")
     notes: Optional[str] = Field(None, description="Admin-only notes for this customer")
 
-    class Config:
-        from_attributes = True
-
 
 # --- Enhanced Admin Summary Schema ---
-class InvoiceSummaryResponse(BaseModel):
+class InvoiceSummaryResponse(DeferredModel):
     total_invoices: int
     total_revenue: float  # (Paid Amount)
     pending_count: int
@@ -138,8 +157,27 @@ class InvoiceSummaryResponse(BaseModel):
     failed_amount_total: float  # <-- NEW
 
 
+# The summary shape is flat and fixed, so its JSON key prefixes are built once
+_SUMMARY_FIELDS = tuple(InvoiceSummaryResponse.model_fields)
+_SUMMARY_KEYS = tuple(
+    (b"," if index else b"{") + f'"{name}":'.encode()
+    for index, name in enumerate(_SUMMARY_FIELDS)
+)
+
+
+def encode_invoice_summary(summary: InvoiceSummaryResponse) -> bytes:
+    """Encode an invoice summary to JSON without going through pydantic."""
+    return (
+        b"".join(
+            key + repr(getattr(summary, name)).encode()
+            for key, name in zip(_SUMMARY_KEYS, _SUMMARY_FIELDS)
+        )
+        + b"}"
+    )
+
+
 # --- NEW User-Specific Summary Schema ---
-class UserInvoiceSummaryResponse(BaseModel):
+class UserInvoiceSummaryResponse(DeferredModel):
     total_invoices: int
     paid_invoices_count: int
     paid_amount_total: float
@@ -149,7 +187,7 @@ class UserInvoiceSummaryResponse(BaseModel):
     failed_amount_total: float
 
 
-class InvoiceUpdate(BaseModel):
+class InvoiceUpdate(DeferredModel):
     buyer_name: Optional[str] = None
     buyer_email: Optional[EmailStr] = None
     buyer_phone: Optional[str] = None
@@ -159,13 +197,13 @@ class InvoiceUpdate(BaseModel):
     amount: Optional[float] = None
     currency: Optional[str] = None
     picked_up: Optional[bool] = None
-    status: Optional[str] = None  # Allow admins to manually change the status
-    invoice_type: Optional[str] = None
+    status: Optional[InvoiceStatus] = None  # Allow admins to manually change the status
+    invoice_type: Optional[InvoiceType] = None
     is_confirmed: Optional[bool] = None  # Admin confirmation status
     notes: Optional[str] = None  # Admin-only notes
 
 
-class EasyKashCallbackPayload(BaseModel):
+class EasyKashCallbackPayload(DeferredModel):
     ProductCode: str
     Amount: str
     ProductType: str
@@ -183,15 +221,14 @@ class EasyKashCallbackPayload(BaseModel):
     voucher: Optional[str] = None
     VoucherData: Optional[str] = None
 
-    class Config:
-        # Allows other fields from EasyKash to be present without causing a validation error
-        extra = "allow"
+    # Allows other fields from EasyKash to be present without causing a validation error
+    model_config = ConfigDict(extra="allow")
 
 
 # --- NEW: Enhanced Analytics Schemas ---
 
 
-class InvoiceActivityBreakdown(BaseModel):
+class InvoiceActivityBreakdown(DeferredModel):
     """Breakdown of invoices by activity type"""
 
     activity: str
@@ -203,7 +240,7 @@ class InvoiceActivityBreakdown(BaseModel):
     failed_count: int
 
 
-class InvoicePaymentMethodBreakdown(BaseModel):
+class InvoicePaymentMethodBreakdown(DeferredModel):
     """Breakdown of invoices by payment method"""
 
     payment_method: str
@@ -212,7 +249,7 @@ class InvoicePaymentMethodBreakdown(BaseModel):
     success_rate: float  # Percentage of paid invoices
 
 
-class InvoiceTypeBreakdown(BaseModel):
+class InvoiceTypeBreakdown(DeferredModel):
     """Breakdown of invoices by type (online/cash)"""
 
     invoice_type: str
@@ -222,7 +259,7 @@ class InvoiceTypeBreakdown(BaseModel):
     pending_count: int
 
 
-class TopCustomerResponse(BaseModel):
+class TopCustomerResponse(DeferredModel):
     """Top customer by spending"""
 
     user_id: int
@@ -234,7 +271,7 @@ class TopCustomerResponse(BaseModel):
     pending_invoices: int
 
 
-class InvoiceDetailedSummaryResponse(BaseModel):
+class InvoiceDetailedSummaryResponse(DeferredModel):
     """Comprehensive invoice analytics summary"""
 
     # Basic counts
@@ -269,7 +306,7 @@ class InvoiceDetailedSummaryResponse(BaseModel):
     not_picked_up_count: int
 
 
-class MonthlyInvoiceAnalytics(BaseModel):
+class MonthlyInvoiceAnalytics(DeferredModel):
     """Monthly invoice analytics with filtering"""
 
     month: str  # Format: "YYYY-MM"
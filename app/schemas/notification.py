@@ -1,33 +1,35 @@
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import RootModel
+
+from app.schemas.base import DeferredModel, FastModel
 
 from datetime import datetime
 
 
-class Notification(BaseModel):
+class Notification(FastModel):
     id: int
     user_id: int
     title: str
     message: str
     is_read: bool = False
     type: str
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime
 
 
-class NotificationCreate(BaseModel):
+class NotificationCreate(DeferredModel):
     user_id: int
     title: str
     message: str
     type: str
 
 
-class NotificationUpdate(BaseModel):
+class NotificationUpdate(DeferredModel):
     title: Optional[str] = None
     message: Optional[str] = None
     type: Optional[str] = None
     is_read: Optional[bool] = None
 
 
-class NotificationList(BaseModel):
-    notifications: List[Notification]
+class NotificationList(RootModel[List[Notification]]):
+    pass
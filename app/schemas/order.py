@@ -1,12 +1,11 @@
 from datetime import date
 from typing import List, Optional
 
-from pydantic import BaseModel
-
+from app.schemas.base import DeferredModel
 from app.schemas.invoice import InvoiceResponse
 
 
-class OrderFilter(BaseModel):
+class OrderFilter(DeferredModel):
     start_date: Optional[date] = None
     end_date: Optional[date] = None
     activity: Optional[str] = None
@@ -17,7 +16,7 @@ class OrderFilter(BaseModel):
     invoice_type: Optional[str] = None
 
 
-class FilteredOrdersResponse(BaseModel):
+class FilteredOrdersResponse(DeferredModel):
     count: int
     total_amount: float
     invoices: List[InvoiceResponse]
@@ -1,33 +1,27 @@
-from typing import List, Optional
+from typing import Optional, Sequence
 
-from fastapi import UploadFile
-from pydantic import BaseModel
+from pydantic import ConfigDict
 
+from app.schemas.base import DeferredModel, FastModel
 
-class CreatePackage(BaseModel):
-    name: str
-    description: str
-    is_image_list: bool = True
 
-
-class CreatePackageWithImages(BaseModel):
+class CreatePackage(DeferredModel):
     name: str
     description: str
     is_image_list: bool = True
 
 
-class PackageResponse(BaseModel):
+class PackageResponse(FastModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     description: str
-    images: List[str]
+    images: Sequence[str]
     is_image_list: bool
 
-    class Config:
-        from_attributes = True
-
 
-class UpdatePackage(BaseModel):
+class UpdatePackage(DeferredModel):
     name: Optional[str] = None
     description: Optional[str] = None
     is_image_list: Optional[bool] = None
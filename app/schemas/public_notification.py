@@ -1,31 +1,30 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import RootModel
 
+from app.schemas.base import DeferredModel, FastModel
 
-class PublicNotification(BaseModel):
+
+class PublicNotification(FastModel):
     id: int
     title: str
     message: str
     type: str
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-
-    class Config:
-        from_attributes = True
+    created_at: datetime
 
 
-class PublicNotificationCreate(BaseModel):
+class PublicNotificationCreate(DeferredModel):
     title: str
     message: str
     type: str = "info"
 
 
-class PublicNotificationUpdate(BaseModel):
+class PublicNotificationUpdate(DeferredModel):
     title: Optional[str] = None
     message: Optional[str] = None
     type: Optional[str] = None
 
 
-class PublicNotificationList(BaseModel):
-    notifications: List[PublicNotification]
+class PublicNotificationList(RootModel[List[PublicNotification]]):
+    pass
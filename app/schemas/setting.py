@@ -1,23 +1,23 @@
 from typing import Dict, Optional
 
-from pydantic import BaseModel, EmailStr, HttpUrl
+from pydantic import EmailStr, HttpUrl
 
+from app.schemas.base import DeferredModel, FastModel
 
-class WebsiteSettingsResponse(BaseModel):
+
+class WebsiteSettingsResponse(FastModel):
+    # URLs and emails are validated on update, so they are read back as plain str
     website_title: str
-    logo_url: Optional[HttpUrl] = None
+    logo_url: Optional[str] = None
     default_currency: str = "USD"
     website_status: str = "active"
     contact_phone: Optional[str] = None
     contact_whatsapp: Optional[str] = None
-    contact_email: Optional[EmailStr] = None
-    social_links: Optional[Dict[str, HttpUrl]] = None
-
-    class Config:
-        from_attributes = True
+    contact_email: Optional[str] = None
+    social_links: Optional[Dict[str, str]] = None
 
 
-class WebsiteSettingsUpdate(BaseModel):
+class WebsiteSettingsUpdate(DeferredModel):
     website_title: Optional[str] = None
     logo_url: Optional[HttpUrl] = None
     default_currency: Optional[str] = None
@@ -1,15 +1,15 @@
 from datetime import datetime
 
-from pydantic import BaseModel
+from app.schemas.base import DeferredModel, FastModel
 
 
-class CreateTestimonial(BaseModel):
+class CreateTestimonial(DeferredModel):
     description: str
     notes: str | None = None
     rating: float
 
 
-class TestimonialResponse(BaseModel):
+class TestimonialResponse(FastModel):
     id: int
     user_id: int
     description: str
@@ -17,6 +17,3 @@ class TestimonialResponse(BaseModel):
     notes: str | None = None
     created_at: datetime
     updated_at: datetime
-
-    class Config:
-        from_attributes = True
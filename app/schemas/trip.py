@@ -1,12 +1,13 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
-from pydantic import BaseModel
+from pydantic import ConfigDict
 
+from app.schemas.base import DeferredModel, FastModel
 from app.schemas.fees import TripFeeBase, TripFeeResponse
 from app.schemas.transfer import TripTransferFeeBase, TripTransferFeeResponse
 
 
-class CreateTrip(BaseModel):
+class CreateTrip(DeferredModel):
     name: str
     description: str
     images: List[str]
@@ -34,12 +35,14 @@ class CreateTrip(BaseModel):
     transfer_fees: List[TripTransferFeeBase] = []
 
 
-class TripResponse(BaseModel):
+class TripResponse(FastModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     description: Optional[str] = None
-    images: List[str]
-    videos: Optional[List[str]] = None
+    images: Sequence[str]
+    videos: Optional[Sequence[str]] = None
     is_image_list: bool = False
     adult_price: float
     child_allowed: bool
@@ -54,19 +57,16 @@ class TripResponse(BaseModel):
     discount_always_available: bool = False
     discount_percentage: Optional[int] = None
     discount_min_people: Optional[int] = None
-    included: Optional[List[str]] = None
+    included: Optional[Sequence[str]] = None
     duration: Optional[int] = None
     duration_unit: Optional[str]
-    not_included: Optional[List[str]] = None
-    terms_and_conditions: Optional[List[str]]
+    not_included: Optional[Sequence[str]] = None
+    terms_and_conditions: Optional[Sequence[str]]
     fees: List[TripFeeResponse] = []
     transfer_fees: List[TripTransferFeeResponse] = []
 
-    class Config:
-        from_attributes = True
-
 
-class UpdateTrip(BaseModel):
+class UpdateTrip(DeferredModel):
     name: Optional[str] = None
     description: Optional[str] = None
     images: Optional[List[str]] = None
@@ -1,15 +1,18 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from pydantic import BaseModel
+from pydantic import TypeAdapter
 
-from .course import CourseResponse
-from .invoice import InvoiceResponse
-from .notification import Notification as NotificationResponse
-from .testimonial import TestimonialResponse
+from .base import DeferredModel, FastModel
 
+if TYPE_CHECKING:
+    from .course import CourseResponse
+    from .invoice import InvoiceResponse
+    from .notification import Notification as NotificationResponse
+    from .testimonial import TestimonialResponse
 
-class UserResponse(BaseModel):
+
+class UserResponse(FastModel):
     id: int
     full_name: str
     email: str
@@ -19,31 +22,39 @@ class UserResponse(BaseModel):
     is_active: bool
     is_blocked: bool
 
-    class Config:
-        from_attributes = True
-
 
-class UserUpdate(BaseModel):
+class UserUpdate(DeferredModel):
     full_name: Optional[str] = None
     email: Optional[str] = None
 
 
-class UserUpdatePassword(BaseModel):
+class UserUpdatePassword(DeferredModel):
     old_password: str
     new_password: str
 
 
-class UserUpdateStatus(BaseModel):
+class UserUpdateStatus(DeferredModel):
     is_active: bool
     is_blocked: bool
 
 
-class UserFullDetailsResponse(BaseModel):
+class UserFullDetailsResponse(FastModel):
     user: UserResponse
-    testimonials: List[TestimonialResponse]
-    invoices: List[InvoiceResponse]
-    notifications: List[NotificationResponse]
-    subscribed_courses: List[CourseResponse]
+    testimonials: "List[TestimonialResponse]"
+    invoices: "List[InvoiceResponse]"
+    notifications: "List[NotificationResponse]"
+    subscribed_courses: "List[CourseResponse]"
+
+
+def rebuild_user_schemas() -> None:
+    """Resolve the related schemas UserFullDetailsResponse refers to by name."""
+    from .course import CourseResponse  # noqa: F401
+    from .invoice import InvoiceResponse  # noqa: F401
+    from .notification import Notification as NotificationResponse  # noqa: F401
+    from .testimonial import TestimonialResponse  # noqa: F401
+
+    UserFullDetailsResponse.model_rebuild()
+
 
-    class Config:
-        from_attributes = True
+# Reusable list validator so the rows are validated in one call
+USER_LIST_ADAPTER = TypeAdapter(List[UserResponse])
@@ -0,0 +1,30 @@
+from app.schemas.admin import AdminResponse
+from app.schemas.invoice import InvoiceResponse
+from app.schemas.notification import Notification
+from app.schemas.package import PackageResponse
+from app.schemas.public_notification import PublicNotification
+from app.schemas.setting import WebsiteSettingsResponse
+from app.schemas.testimonial import TestimonialResponse
+from app.schemas.trip import TripResponse
+from app.schemas.user import UserResponse, rebuild_user_schemas
+
+# Deferred response models used on hot paths
+_RESPONSE_MODELS = (
+    AdminResponse,
+    InvoiceResponse,
+    Notification,
+    PackageResponse,
+    PublicNotification,
+    TestimonialResponse,
+    TripResponse,
+    UserResponse,
+    WebsiteSettingsResponse,
+)
+
+
+def build_response_schemas() -> int:
+    """Build the deferred response schemas now so no request pays for it."""
+    rebuild_user_schemas()
+    for model in _RESPONSE_MODELS:
+        model.model_rebuild()
+    return len(_RESPONSE_MODELS) + 1
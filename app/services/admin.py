@@ -2,8 +2,9 @@ import math
 from typing import List, Optional
 
 from fastapi import HTTPException
-from sqlalchemy import desc, func, select
-from sqlalchemy.orm import Session
+from pydantic import TypeAdapter
+from sqlalchemy import delete, desc, func, select, update
+from sqlalchemy.orm import Session, selectinload
 
 from app.core.exception_handler import db_exception_handler
 from app.core.hashing import hash_password, verify_password
@@ -11,6 +12,7 @@ from app.models.admin import Admin
 from app.models.testimonial import Testimonial
 from app.models.user import User
 from app.schemas.admin import (
+    ADMIN_LIST_ADAPTER,
     AdminResponse,
     AdminUpdate,
     AdminUpdatePassword,
@@ -22,21 +24,111 @@ from app.schemas.invoice import InvoiceResponse
 from app.schemas.notification import Notification as NotificationResponse
 from app.schemas.testimonial import TestimonialResponse
 from app.schemas.user import (
+    USER_LIST_ADAPTER,
     UserFullDetailsResponse,
     UserResponse,
     UserUpdate,
     UserUpdateStatus,
+    rebuild_user_schemas,
 )
 
+rebuild_user_schemas()
+
+# Reusable list validators so the nested collections are validated in one call
+TESTIMONIAL_LIST_ADAPTER = TypeAdapter(List[TestimonialResponse])
+INVOICE_LIST_ADAPTER = TypeAdapter(List[InvoiceResponse])
+NOTIFICATION_LIST_ADAPTER = TypeAdapter(List[NotificationResponse])
+COURSE_LIST_ADAPTER = TypeAdapter(List[CourseResponse])
+
+# Columns UserResponse needs; list endpoints select these instead of whole rows
+_USER_COLUMNS = (
+    User.id,
+    User.full_name,
+    User.email,
+    User.created_at,
+    User.updated_at,
+    User.last_login,
+    User.is_active,
+    User.is_blocked,
+)
+_TESTIMONIAL_COLUMNS = (
+    Testimonial.id,
+    Testimonial.user_id,
+    Testimonial.description,
+    Testimonial.notes,
+    Testimonial.rating,
+    Testimonial.is_accepted,
+    Testimonial.is_rejected,
+    Testimonial.created_at,
+    Testimonial.updated_at,
+)
+
+
+def _user_response_from_row(u: User) -> UserResponse:
+    """
+    Build a UserResponse from a DB row without running validation.
+
+    The column types and constraints already guarantee the field types, so
+    no validators run here. Anything added to UserResponse that the row does
+    not enforce must go through model_validate instead.
+    """
+    return UserResponse.model_construct(
+        id=u.id,
+        full_name=u.full_name,
+        email=u.email,
+        created_at=u.created_at,
+        updated_at=u.updated_at,
+        last_login=u.last_login,
+        is_active=u.is_active,
+        is_blocked=u.is_blocked,
+    )
+
+
+def _admin_response_from_row(a: Admin) -> AdminResponse:
+    """Build an AdminResponse from a DB row without running validation."""
+    return AdminResponse.model_construct(
+        id=a.id,
+        full_name=a.full_name,
+        username=a.username,
+        email=a.email,
+        created_at=a.created_at,
+        updated_at=a.updated_at,
+        role=a.role,
+        # admin_level is stored as a string column
+        admin_level=int(a.admin_level),
+        is_active=a.is_active,
+        last_login=a.last_login,
+    )
+
 
 class AdminServices:
     def __init__(self, db: Session):
         self.db = db
 
     def get_users(self):
-        stmt = select(User)
-        users = self.db.execute(stmt).scalars().all()
-        return users
+        stmt = select(*_USER_COLUMNS)
+        rows = self.db.execute(stmt).all()
+        return USER_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+
+    def _list_testimonials(self, *criteria):
+        # Plain column rows with the author's public fields nested under "user"
+        stmt = (
+            select(*_TESTIMONIAL_COLUMNS, User.full_name, User.email)
+            .join(User, Testimonial.user_id == User.id)
+            .where(*criteria)
+        )
+        testimonials = []
+        for row in self.db.execute(stmt).mappings():
+            testimonial = {
+                column.key: row[column.key] for column in _TESTIMONIAL_COLUMNS
+            }
+            testimonial["user"] = {
+                "id": row["user_id"],
+                "full_name": row["full_name"],
+                "email": row["email"],
+            }
+            testimonials.append(testimonial)
+        return testimonials
 
     def get_all_users(
         self,
@@ -44,30 +136,44 @@ class AdminServices:
         page_size: int = 20,
         name: Optional[str] = None,
         email: Optional[str] = None,
+        cursor: Optional[int] = None,
     ) -> PaginatedUsersResponse:
         offset = (page - 1) * page_size
 
-        # Base query for filtering
-        base_stmt = select(User)
+        # Filter clauses, shared by the page query and the fallback count
+        clauses = []
         if name:
             if "@" in name:
-                base_stmt = base_stmt.where(User.email.ilike(f"%{name}%"))
+                clauses.append(User.email.ilike(f"%{name}%"))
             else:
-                base_stmt = base_stmt.where(User.full_name.ilike(f"%{name}%"))
+                clauses.append(User.full_name.ilike(f"%{name}%"))
         if email:
-            base_stmt = base_stmt.where(User.email.ilike(f"%{email}%"))
+            clauses.append(User.email.ilike(f"%{email}%"))
+        base_stmt = select(*_USER_COLUMNS).where(*clauses).order_by(User.id)
+
+        if cursor is not None:
+            return self._get_users_after(base_stmt, cursor, page, page_size)
 
-        # Get total count
-        count_stmt = select(func.count()).select_from(base_stmt.subquery())
-        total = self.db.execute(count_stmt).scalar()
+        # Fetch the page and the filtered total in one round trip
+        stmt = (
+            base_stmt.add_columns(func.count().over().label("total"))
+            .offset(offset)
+            .limit(page_size)
+        )
+        rows = self.db.execute(stmt).all()
+
+        if rows:
+            total = rows[0].total
+        elif offset:
+            # Page past the end: no rows to carry the window total
+            count_stmt = select(func.count(User.id)).where(*clauses)
+            total = self.db.execute(count_stmt).scalar()
+        else:
+            total = 0
 
         if total == 0:
             raise HTTPException(status_code=404, detail="No users found")
 
-        # Get paginated users
-        stmt = base_stmt.offset(offset).limit(page_size)
-        users = self.db.execute(stmt).scalars().all()
-
         # Calculate pagination metadata
         total_pages = math.ceil(total / page_size)
         has_next = page < total_pages
@@ -76,10 +182,7 @@ class AdminServices:
         previous_page = page - 1 if has_previous else None
 
         return PaginatedUsersResponse(
-            users=[
-                UserResponse.model_validate(user, from_attributes=True)
-                for user in users
-            ],
+            users=USER_LIST_ADAPTER.validate_python(rows, from_attributes=True),
             total=total,
             page=page,
             page_size=page_size,
@@ -90,6 +193,28 @@ class AdminServices:
             previous_page=previous_page,
         )
 
+    def _get_users_after(
+        self, base_stmt, cursor: int, page: int, page_size: int
+    ) -> PaginatedUsersResponse:
+        # Keyset page: seek past the last seen id instead of skipping rows
+        stmt = base_stmt.where(User.id > cursor).limit(page_size + 1)
+        users = self.db.execute(stmt).all()
+
+        if not users and cursor == 0:
+            raise HTTPException(status_code=404, detail="No users found")
+
+        has_next = len(users) > page_size
+        users = users[:page_size]
+
+        return PaginatedUsersResponse(
+            users=USER_LIST_ADAPTER.validate_python(users, from_attributes=True),
+            page=page,
+            page_size=page_size,
+            has_next=has_next,
+            has_previous=cursor > 0,
+            next_cursor=users[-1].id if has_next else None,
+        )
+
     @db_exception_handler
     def get_all_admins(self) -> List[AdminResponse]:
         stmt = select(Admin)
@@ -97,37 +222,29 @@ class AdminServices:
         if not admins:
             raise HTTPException(404, detail="Admins not found")
         else:
-            return [
-                AdminResponse.model_validate(admin, from_attributes=True)
-                for admin in admins
-            ]
+            return ADMIN_LIST_ADAPTER.validate_python(admins, from_attributes=True)
 
     @db_exception_handler
     def update_admin(self, admin: AdminUpdate, id: int):
         stmt = select(Admin).where(Admin.id == id)
         updated_admin = self.db.execute(stmt).scalars().first()
         if updated_admin:
-            data = admin.model_dump(exclude_unset=True)
-            for field, value in data.items():
-                setattr(updated_admin, field, value)
+            for field in admin.model_fields_set:
+                setattr(updated_admin, field, getattr(admin, field))
+            if "password" in admin.model_fields_set:
+                updated_admin.password = hash_password(admin.password)
             self.db.commit()
-            self.db.refresh(updated_admin)
             return {
                 "success": True,
                 "message": "Admin Updated successfuly",
-                "admin": AdminResponse.model_validate(
-                    updated_admin, from_attributes=True
-                ),
+                "admin": _admin_response_from_row(updated_admin),
             }
         else:
             raise HTTPException(404, detail="Admin not found")
 
     @db_exception_handler
     def get_recent_users(self, limit: int = 10):
-        if hasattr(User, "created_at"):
-            stmt = select(User).order_by(desc(User.created_at)).limit(limit)
-        else:
-            stmt = select(User).order_by(desc(User.id)).limit(limit)
+        stmt = select(User).order_by(desc(User.created_at)).limit(limit)
         return self.db.execute(stmt).scalars().all()
 
     @db_exception_handler
@@ -137,31 +254,31 @@ class AdminServices:
         if verify_password(user.old_password, updated_admin.password):
             updated_admin.password = hash_password(user.new_password)
             self.db.commit()
-            self.db.refresh(updated_admin)
             return {
                 "success": True,
                 "message": "Password Updated successfuly",
-                "user": AdminResponse.model_validate(
-                    updated_admin, from_attributes=True
-                ),
+                "user": _admin_response_from_row(updated_admin),
             }
         else:
             raise HTTPException(400, detail="Invalid cerdentials")
 
     @db_exception_handler
     def update_user_status(self, status: UserUpdateStatus, id: int):
-        stmt = select(User).where(User.id == id)
-        updated_user = self.db.execute(stmt).scalars().first()
+        stmt = (
+            update(User)
+            .where(User.id == id)
+            .values(
+                {field: getattr(status, field) for field in status.model_fields_set}
+            )
+            .returning(*_USER_COLUMNS)
+        )
+        updated_user = self.db.execute(stmt).first()
         if updated_user:
-            data = status.model_dump(exclude_unset=True)
-            for field, value in data.items():
-                setattr(updated_user, field, value)
             self.db.commit()
-            self.db.refresh(updated_user)
             return {
                 "success": True,
                 "message": "User Updated successfuly",
-                "user": UserResponse.model_validate(updated_user, from_attributes=True),
+                "user": _user_response_from_row(updated_user),
             }
         else:
             raise HTTPException(404, detail="user not found")
@@ -190,11 +307,13 @@ class AdminServices:
 
     @db_exception_handler
     def block_user(self, id: int):
-        stmt = select(User).where(User.id == id)
-        user = self.db.execute(stmt).scalars().first()
-        if user:
-            user.is_active = False
-            user.is_blocked = True
+        stmt = (
+            update(User)
+            .where(User.id == id)
+            .values(is_active=False, is_blocked=True)
+            .returning(User.id)
+        )
+        if self.db.execute(stmt).scalar_one_or_none() is not None:
             self.db.commit()
             return {"success": True, "message": "User blocked successfully"}
         else:
@@ -202,11 +321,13 @@ class AdminServices:
 
     @db_exception_handler
     def unblock_user(self, id: int):
-        stmt = select(User).where(User.id == id)
-        user = self.db.execute(stmt).scalars().first()
-        if user:
-            user.is_active = True
-            user.is_blocked = False
+        stmt = (
+            update(User)
+            .where(User.id == id)
+            .values(is_active=True, is_blocked=False)
+            .returning(User.id)
+        )
+        if self.db.execute(stmt).scalar_one_or_none() is not None:
             self.db.commit()
             return {"success": True, "message": "User unblocked successfully"}
         else:
@@ -217,14 +338,13 @@ class AdminServices:
         stmt = select(User).where(User.id == id)
         user = self.db.execute(stmt).scalars().first()
         if user:
-            user.full_name = updated_user.full_name
-            user.email = updated_user.email
+            for field in updated_user.model_fields_set:
+                setattr(user, field, getattr(updated_user, field))
             self.db.commit()
-            self.db.refresh(user)
             return {
                 "success": True,
                 "message": "User Updated successfuly",
-                "user": UserResponse.model_validate(user, from_attributes=True),
+                "user": _user_response_from_row(user),
             }
         else:
             raise HTTPException(404, detail="User not found")
@@ -236,7 +356,6 @@ class AdminServices:
         if user:
             user.password = hash_password(new_password.password)
             self.db.commit()
-            self.db.refresh(user)
             return {
                 "success": True,
                 "message": "User Password Updated successfuly",
@@ -246,7 +365,9 @@ class AdminServices:
 
     @db_exception_handler
     def get_user_testminals(self, id: int):
-        stmt = select(User).where(User.id == id)
+        stmt = (
+            select(User).options(selectinload(User.testimonials)).where(User.id == id)
+        )
         user = self.db.execute(stmt).scalars().first()
         if user:
             return user.testimonials
@@ -255,22 +376,15 @@ class AdminServices:
 
     @db_exception_handler
     def get_all_testimonials(self):
-        stmt = select(Testimonial)
-        testimonials = self.db.execute(stmt).scalars().all()
-        return testimonials
+        return self._list_testimonials()
 
     @db_exception_handler
     def get_accepted_testimonials(self):
-
-        stmt = select(Testimonial).where(Testimonial.is_accepted == True)
-        testimonials = self.db.execute(stmt).scalars().all()
-        return testimonials
+        return self._list_testimonials(Testimonial.is_accepted == True)
 
     @db_exception_handler
     def get_unaccepted_testimonials(self):
-        stmt = select(Testimonial).where(Testimonial.is_accepted == False)
-        testimonials = self.db.execute(stmt).scalars().all()
-        return testimonials
+        return self._list_testimonials(Testimonial.is_accepted == False)
 
     @db_exception_handler
     def get_testimonial_by_id(self, id: int):
@@ -280,7 +394,7 @@ class AdminServices:
 
     @db_exception_handler
     def get_user_testimonials(self, user_id: int):
-        stmt = select(Testimonial).where(Testimonial.testimonial_owner == user_id)
+        stmt = select(Testimonial).where(Testimonial.user_id == user_id)
         testimonials = self.db.execute(stmt).scalars().all()
         return testimonials
 
@@ -297,48 +411,52 @@ class AdminServices:
 
     @db_exception_handler
     def accept_testimonial(self, id: int):
-        stmt = select(Testimonial).where(Testimonial.id == id)
-        testimonial = self.db.execute(stmt).scalars().first()
-        if testimonial:
-            testimonial.is_accepted = True
-            testimonial.is_rejected = False
+        stmt = (
+            update(Testimonial)
+            .where(Testimonial.id == id)
+            .values(is_accepted=True, is_rejected=False)
+            .returning(Testimonial.id)
+        )
+        if self.db.execute(stmt).scalar_one_or_none() is not None:
             self.db.commit()
-            self.db.refresh(testimonial)
             return {"success": True, "message": "Testimonial accepted successfully"}
         else:
             raise HTTPException(404, detail="Testimonial not found")
 
     @db_exception_handler
     def reject_testimonial(self, id: int):
-        stmt = select(Testimonial).where(Testimonial.id == id)
-        testimonial = self.db.execute(stmt).scalars().first()
-        if testimonial:
-            testimonial.is_accepted = False
-            testimonial.is_rejected = True
+        stmt = (
+            update(Testimonial)
+            .where(Testimonial.id == id)
+            .values(is_accepted=False, is_rejected=True)
+            .returning(Testimonial.id)
+        )
+        if self.db.execute(stmt).scalar_one_or_none() is not None:
             self.db.commit()
-            self.db.refresh(testimonial)
             return {"success": True, "message": "Testimonial rejected successfully"}
         else:
             raise HTTPException(404, detail="Testimonial not found")
 
     @db_exception_handler
     def unaccept_testimonial(self, id: int):
-        stmt = select(Testimonial).where(Testimonial.id == id)
-        testimonial = self.db.execute(stmt).scalars().first()
-        if testimonial:
-            testimonial.is_accepted = False
+        stmt = (
+            update(Testimonial)
+            .where(Testimonial.id == id)
+            .values(is_accepted=False)
+            .returning(Testimonial.id)
+        )
+        if self.db.execute(stmt).scalar_one_or_none() is not None:
             self.db.commit()
-            self.db.refresh(testimonial)
             return {"success": True, "message": "Testimonial unaccepted successfully"}
         else:
             raise HTTPException(404, detail="Testimonial not found")
 
     @db_exception_handler
     def delete_all_testimonials(self):
-        stmt = select(Testimonial)
-        testimonials = self.db.execute(stmt).scalars().all()
-        for testimonial in testimonials:
-            self.db.delete(testimonial)
+        # Testimonials have no dependents, so one bulk DELETE is enough
+        self.db.execute(
+            delete(Testimonial).execution_options(synchronize_session=False)
+        )
         self.db.commit()
         return {"success": True, "message": "All testimonials deleted successfully"}
 
@@ -350,21 +468,17 @@ class AdminServices:
             raise HTTPException(404, detail="User not found")
 
         return UserFullDetailsResponse(
-            user=UserResponse.model_validate(user, from_attributes=True),
-            testimonials=[
-                TestimonialResponse.model_validate(t, from_attributes=True)
-                for t in (user.testimonials or [])
-            ],
-            invoices=[
-                InvoiceResponse.model_validate(inv, from_attributes=True)
-                for inv in (user.invoices or [])
-            ],
-            notifications=[
-                NotificationResponse.model_validate(n, from_attributes=True)
-                for n in (user.notifications or [])
-            ],
-            subscribed_courses=[
-                CourseResponse.model_validate(c, from_attributes=True)
-                for c in (user.subscribed_courses or [])
-            ],
+            user=_user_response_from_row(user),
+            testimonials=TESTIMONIAL_LIST_ADAPTER.validate_python(
+                user.testimonials or [], from_attributes=True
+            ),
+            invoices=INVOICE_LIST_ADAPTER.validate_python(
+                user.invoices or [], from_attributes=True
+            ),
+            notifications=NOTIFICATION_LIST_ADAPTER.validate_python(
+                user.notifications or [], from_attributes=True
+            ),
+            subscribed_courses=COURSE_LIST_ADAPTER.validate_python(
+                user.subscribed_courses or [], from_attributes=True
+            ),
         )
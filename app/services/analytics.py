@@ -71,83 +71,91 @@ class AnalyticsServices:
     def get_cancelled_invoices_count(self):
         return self.db.query(Invoice).filter(Invoice.status == "CANCELLED").count()
 
-    def get_all(self):
-        # Invoice revenue metrics - All converted to EGP
-        total_invoice_revenue = (
-            self.db.query(func.sum(Invoice.amount * Invoice.convert_rate))
-            .filter(Invoice.status == "PAID")
-            .scalar()
-            or 0.0
-        )
-        pending_invoice_revenue = (
-            self.db.query(func.sum(Invoice.amount * Invoice.convert_rate))
-            .filter(Invoice.status == "PENDING")
-            .scalar()
-            or 0.0
-        )
-
-        # Confirmed/unconfirmed invoices
-        confirmed_invoices = (
-            self.db.query(Invoice).filter(Invoice.is_confirmed == True).count()
-        )
-        unconfirmed_invoices = (
-            self.db.query(Invoice).filter(Invoice.is_confirmed == False).count()
+    def _user_counts(self):
+        stmt = select(
+            func.count().label("total"),
+            func.count().filter(User.is_active == True).label("active"),
+            func.count().filter(User.is_active == False).label("inactive"),
+            func.count().filter(User.is_blocked == True).label("blocked"),
+            func.count().filter(User.is_blocked == False).label("unblocked"),
+        ).select_from(User)
+        return self.db.execute(stmt).one()
+
+    def _testimonial_counts(self):
+        stmt = select(
+            func.count().label("total"),
+            func.count().filter(Testimonial.is_accepted == True).label("accepted"),
+            func.count().filter(Testimonial.is_accepted == False).label("unaccepted"),
+        ).select_from(Testimonial)
+        return self.db.execute(stmt).one()
+
+    def _content_counts(self):
+        stmt = select(
+            select(func.count()).select_from(Trip).scalar_subquery().label("trips"),
+            select(func.count())
+            .select_from(Package)
+            .scalar_subquery()
+            .label("packages"),
+            select(func.count()).select_from(Course).scalar_subquery().label("courses"),
         )
+        return self.db.execute(stmt).one()
+
+    def _invoice_counts(self):
+        # Revenue metrics are converted to EGP
+        revenue = func.sum(Invoice.amount * Invoice.convert_rate)
+        stmt = select(
+            func.count().label("total"),
+            func.count().filter(Invoice.status == "PENDING").label("pending"),
+            func.count().filter(Invoice.status == "EXPIRED").label("expired"),
+            func.count().filter(Invoice.status == "PAID").label("paid"),
+            func.count().filter(Invoice.status == "NEW").label("unpaid"),
+            func.count().filter(Invoice.status == "CANCELLED").label("cancelled"),
+            func.count().filter(Invoice.is_confirmed == True).label("confirmed"),
+            func.count().filter(Invoice.is_confirmed == False).label("unconfirmed"),
+            func.count().filter(Invoice.picked_up == True).label("picked_up"),
+            func.count().filter(Invoice.picked_up == False).label("not_picked_up"),
+            revenue.filter(Invoice.status == "PAID").label("paid_revenue"),
+            revenue.filter(Invoice.status == "PENDING").label("pending_revenue"),
+        ).select_from(Invoice)
+        return self.db.execute(stmt).one()
 
-        # Pickup tracking
-        picked_up_invoices = (
-            self.db.query(Invoice).filter(Invoice.picked_up == True).count()
-        )
-        not_picked_up_invoices = (
-            self.db.query(Invoice).filter(Invoice.picked_up == False).count()
-        )
+    def get_all(self):
+        users = self._user_counts()
+        testimonials = self._testimonial_counts()
+        content = self._content_counts()
+        invoices = self._invoice_counts()
 
         return {
             # User metrics
-            "users_count": self.get_users_count(),
-            "active_users_count": self.get_active_users_count(),
-            "inactive_users_count": self.get_inactive_users_count(),
-            "blocked_users_count": self.get_blocked_users_count(),
-            "unblocked_users_count": self.get_unblocked_users_count(),
+            "users_count": users.total,
+            "active_users_count": users.active,
+            "inactive_users_count": users.inactive,
+            "blocked_users_count": users.blocked,
+            "unblocked_users_count": users.unblocked,
             # Content metrics
-            "trips_count": self.get_trips_count(),
-            "packages_count": self.get_packages_count(),
-            "courses_count": self.get_courses_count(),
+            "trips_count": content.trips,
+            "packages_count": content.packages,
+            "courses_count": content.courses,
             # Testimonial metrics
-            "testimonials_count": self.get_testimonials_count(),
-            "accepted_testimonials_count": self.get_accepted_testimonials_count(),
-            "unaccepted_testimonials_count": self.get_unaccepted_testimonials_count(),
+            "testimonials_count": testimonials.total,
+            "accepted_testimonials_count": testimonials.accepted,
+            "unaccepted_testimonials_count": testimonials.unaccepted,
             # Invoice count metrics
-            "invoices_count": self.get_invoices_count(),
-            "pending_invoices_count": self.get_pending_invoices_count(),
-            "expired_invoices_count": self.get_expired_invoices_count(),
-            "paid_invoices_count": self.get_paid_invoices_count(),
-            "unpaid_invoices_count": self.get_unpaid_invoices_count(),
-            "cancelled_invoices_count": self.get_cancelled_invoices_count(),
+            "invoices_count": invoices.total,
+            "pending_invoices_count": invoices.pending,
+            "expired_invoices_count": invoices.expired,
+            "paid_invoices_count": invoices.paid,
+            "unpaid_invoices_count": invoices.unpaid,
+            "cancelled_invoices_count": invoices.cancelled,
             # Invoice revenue metrics
-            "total_invoice_revenue": round(total_invoice_revenue, 2),
-            "pending_invoice_revenue": round(pending_invoice_revenue, 2),
+            "total_invoice_revenue": round(invoices.paid_revenue or 0.0, 2),
+            "pending_invoice_revenue": round(invoices.pending_revenue or 0.0, 2),
             # Invoice confirmation tracking
-            "confirmed_invoices_count": confirmed_invoices,
-            "unconfirmed_invoices_count": unconfirmed_invoices,
+            "confirmed_invoices_count": invoices.confirmed,
+            "unconfirmed_invoices_count": invoices.unconfirmed,
             # Invoice pickup tracking
-            "picked_up_invoices_count": picked_up_invoices,
-            "not_picked_up_invoices_count": not_picked_up_invoices,
-        }
-
-        return {
-            "stats": {
-                "revenue_today": round(revenue_today, 2),
-                "sales_count_today": sales_count_today,
-                "trips_booked_today": trips_today,
-                "courses_booked_today": courses_today,
-                "pending_invoices_today": pending_today,
-            },
-            "charts": {
-                "sales_over_time": sales_chart_data,
-                "activity_distribution": activity_distribution,
-            },
-            "recent_transactions": recent_transactions,
+            "picked_up_invoices_count": invoices.picked_up,
+            "not_picked_up_invoices_count": invoices.not_picked_up,
         }
 
     def get_dashboard_summary(self, month: int = None, year: int = None):
@@ -438,6 +446,11 @@ class AnalyticsServices:
             (confirmed_count / total_inv_count * 100) if total_inv_count > 0 else 0.0
         )
 
+        users = self._user_counts()
+        testimonials = self._testimonial_counts()
+        content = self._content_counts()
+        invoices = self._invoice_counts()
+
         # Recent transactions
         recent_trans_query = self.db.query(Invoice)
         if is_filtered_view:
@@ -483,52 +496,34 @@ class AnalyticsServices:
             "recent_transactions": recent_transactions,
             # --- More detailed analytics ---
             "users": {
-                "total": self.get_users_count(),
-                "active": self.get_active_users_count(),
-                "inactive": self.get_inactive_users_count(),
-                "blocked": self.get_blocked_users_count(),
-                "unblocked": self.get_unblocked_users_count(),
+                "total": users.total,
+                "active": users.active,
+                "inactive": users.inactive,
+                "blocked": users.blocked,
+                "unblocked": users.unblocked,
             },
             "testimonials": {
-                "total": self.get_testimonials_count(),
-                "accepted": self.get_accepted_testimonials_count(),
-                "unaccepted": self.get_unaccepted_testimonials_count(),
+                "total": testimonials.total,
+                "accepted": testimonials.accepted,
+                "unaccepted": testimonials.unaccepted,
             },
             "content": {
-                "trips": self.get_trips_count(),
-                "packages": self.get_packages_count(),
-                "courses": self.get_courses_count(),
+                "trips": content.trips,
+                "packages": content.packages,
+                "courses": content.courses,
             },
             "invoices": {
-                "total": self.get_invoices_count(),
-                "pending": self.get_pending_invoices_count(),
-                "expired": self.get_expired_invoices_count(),
-                "paid": self.get_paid_invoices_count(),
-                "unpaid": self.get_unpaid_invoices_count(),
-                "cancelled": self.get_cancelled_invoices_count(),
-                "confirmed": self.db.query(Invoice)
-                .filter(Invoice.is_confirmed == True)
-                .count(),
-                "unconfirmed": self.db.query(Invoice)
-                .filter(Invoice.is_confirmed == False)
-                .count(),
-                "picked_up": self.db.query(Invoice)
-                .filter(Invoice.picked_up == True)
-                .count(),
-                "not_picked_up": self.db.query(Invoice)
-                .filter(Invoice.picked_up == False)
-                .count(),
-                "total_invoice_revenue": float(
-                    self.db.query(func.sum(Invoice.amount * Invoice.convert_rate))
-                    .filter(Invoice.status == "PAID")
-                    .scalar()
-                    or 0.0
-                ),
-                "pending_invoice_revenue": float(
-                    self.db.query(func.sum(Invoice.amount * Invoice.convert_rate))
-                    .filter(Invoice.status == "PENDING")
-                    .scalar()
-                    or 0.0
-                ),
+                "total": invoices.total,
+                "pending": invoices.pending,
+                "expired": invoices.expired,
+                "paid": invoices.paid,
+                "unpaid": invoices.unpaid,
+                "cancelled": invoices.cancelled,
+                "confirmed": invoices.confirmed,
+                "unconfirmed": invoices.unconfirmed,
+                "picked_up": invoices.picked_up,
+                "not_picked_up": invoices.not_picked_up,
+                "total_invoice_revenue": float(invoices.paid_revenue or 0.0),
+                "pending_invoice_revenue": float(invoices.pending_revenue or 0.0),
             },
         }
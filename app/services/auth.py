@@ -1,6 +1,9 @@
+import logging
 from datetime import datetime, timezone
+from typing import Optional
 
-from fastapi import HTTPException
+from fastapi import BackgroundTasks, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -20,19 +23,38 @@ from app.schemas.admin import AdminResponse
 from app.schemas.auth import AdminCreate, AdminLogin, UserCreate, UserLogin
 from app.schemas.user import UserResponse
 
+logger = logging.getLogger(__name__)
+
+
+def _notify_safely(notify, *args):
+    # Notifications must never fail the request that triggered them
+    try:
+        notify(*args)
+    except Exception:
+        logger.exception("Failed to send Telegram notification")
+
+
+def _run_after_response(background_tasks: Optional[BackgroundTasks], notify, *args):
+    if background_tasks is None:
+        _notify_safely(notify, *args)
+    else:
+        background_tasks.add_task(_notify_safely, notify, *args)
+
 
 class AuthServices:
     def __init__(self, db: Session):
         self.db = db
 
     @db_exception_handler
-    def create_new_user(self, user: UserCreate):
+    async def create_new_user(
+        self, user: UserCreate, background_tasks: Optional[BackgroundTasks] = None
+    ):
         verify_recaptcha(user.recaptcha_token, expected_action="register")
 
         creation_date = datetime.now(timezone.utc)
         new_user = User(
             full_name=user.full_name,
-            password=hash_password(user.password),
+            password=await run_in_threadpool(hash_password, user.password),
             email=user.email,
             last_login=creation_date.isoformat(),
         )
@@ -42,11 +64,9 @@ class AuthServices:
         token = create_user_access_token(new_user.id, creation_date.isoformat())
 
         # Send Telegram notification to admins about new user registration
-        try:
-            notify_new_registration(user.email, user.full_name)
-        except Exception as e:
-            # Log the error but don't fail the registration
-            print(f"Failed to send Telegram notification: {e}")
+        _run_after_response(
+            background_tasks, notify_new_registration, user.email, user.full_name
+        )
 
         # Send welcome email to new user
         # try:
@@ -70,7 +90,7 @@ class AuthServices:
         return data
 
     @db_exception_handler
-    def user_login(self, user: UserLogin):
+    async def user_login(self, user: UserLogin):
         verify_recaptcha(user.recaptcha_token, expected_action="login")
 
         stmt = select(User).where(User.email == user.email)
@@ -79,11 +99,13 @@ class AuthServices:
         if not logged_user:
             raise HTTPException(400, detail="Invalid credentials")
 
-        if verify_password(user.password, logged_user.password):
+        # bcrypt is CPU-bound; keep it off the event loop
+        if await run_in_threadpool(
+            verify_password, user.password, logged_user.password
+        ):
             login_date = datetime.now(timezone.utc)
             logged_user.last_login = login_date.isoformat()
             self.db.commit()
-            self.db.refresh(logged_user)
 
             return {
                 "success": True,
@@ -103,15 +125,14 @@ class AuthServices:
         logout_date = datetime.now(timezone.utc)
         logged_user.last_login = logout_date.isoformat()
         self.db.commit()
-        self.db.refresh(logged_user)
         return {"success": True, "message": "Logout Successfully"}
 
     @db_exception_handler
-    def create_new_admin(self, admin: AdminCreate):
+    async def create_new_admin(self, admin: AdminCreate):
         new_admin = Admin(
             full_name=admin.full_name,
             username=admin.username,
-            password=hash_password(admin.password),
+            password=await run_in_threadpool(hash_password, admin.password),
             email=admin.email,
             admin_level=admin.admin_level,
             last_login=datetime.now(timezone.utc).isoformat(),
@@ -127,7 +148,9 @@ class AuthServices:
         return data
 
     @db_exception_handler
-    def admin_login(self, admin: AdminLogin):
+    async def admin_login(
+        self, admin: AdminLogin, background_tasks: Optional[BackgroundTasks] = None
+    ):
         if "@" in admin.username_or_email:
             stmt = select(Admin).where(Admin.email == admin.username_or_email)
         else:
@@ -135,20 +158,17 @@ class AuthServices:
         logged_admin = self.db.execute(stmt).scalars().first()
         if not logged_admin:
             raise HTTPException(400, detail="Invalid cerdentials")
-        if verify_password(admin.password, logged_admin.password):
+        if await run_in_threadpool(
+            verify_password, admin.password, logged_admin.password
+        ):
             login_date = datetime.now(timezone.utc)
             logged_admin.last_login = login_date.isoformat()
             self.db.commit()
-            self.db.refresh(logged_admin)
 
             # Send Telegram notification about admin login
-            try:
-                notify_admin_login(
-                    logged_admin.username, "Unknown IP"
-                )  # You can pass actual IP from request
-            except Exception as e:
-                # Log the error but don't fail the login
-                print(f"Failed to send Telegram notification: {e}")
+            _run_after_response(
+                background_tasks, notify_admin_login, logged_admin.username, "Unknown IP"
+            )  # You can pass actual IP from request
 
             data = {
                 "success": True,
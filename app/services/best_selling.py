@@ -1,12 +1,17 @@
 from typing import List, Optional
 
-from sqlalchemy import and_, desc
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, desc, exists, func, select, update
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.models.best_selling import BestSelling, ItemType
 from app.models.course import Course
 from app.models.trip import Trip
-from app.schemas.best_selling import BestSellingCreate, BestSellingUpdate
+from app.schemas.best_selling import (
+    BEST_SELLING_LIST_ADAPTER,
+    BestSellingCreate,
+    BestSellingResponse,
+    BestSellingUpdate,
+)
 
 
 class BestSellingService:
@@ -26,28 +31,27 @@ class BestSellingService:
             else None
         )
 
-        # Check if item exists
-        if best_selling_data.item_type == ItemType.COURSE:
-            course = (
-                db.query(Course).filter(Course.id == best_selling_data.item_id).first()
-            )
-            if not course:
-                raise ValueError(
-                    f"Course with id {best_selling_data.item_id} not found"
+        # Check item existence and ranking conflict in one round trip
+        item_model = Course if best_selling_data.item_type == ItemType.COURSE else Trip
+        checks = db.execute(
+            select(
+                exists()
+                .where(item_model.id == best_selling_data.item_id)
+                .label("item_exists"),
+                exists()
+                .where(
+                    BestSelling.ranking_position == best_selling_data.ranking_position
                 )
-        else:
-            trip = db.query(Trip).filter(Trip.id == best_selling_data.item_id).first()
-            if not trip:
-                raise ValueError(f"Trip with id {best_selling_data.item_id} not found")
+                .label("rank_taken"),
+            )
+        ).one()
 
-        # Check if ranking position is already taken
-        existing = (
-            db.query(BestSelling)
-            .filter(BestSelling.ranking_position == best_selling_data.ranking_position)
-            .first()
-        )
+        if not checks.item_exists:
+            raise ValueError(
+                f"{item_model.__name__} with id {best_selling_data.item_id} not found"
+            )
 
-        if existing:
+        if checks.rank_taken:
             raise ValueError(
                 f"Ranking position {best_selling_data.ranking_position} is already taken"
             )
@@ -82,7 +86,10 @@ class BestSellingService:
         skip: int = 0,
         limit: int = 100,
         item_type: Optional[ItemType] = None,
-    ) -> tuple[List[BestSelling], int]:
+    ) -> tuple[List[BestSellingResponse], int]:
+        # selectinload here: each row has only one of course/trip set, so joining
+        # both would widen every row with a block of NULL columns. The single-type
+        # listings below use joinedload instead (wider rows, one round trip).
         query = db.query(BestSelling).options(
             selectinload(BestSelling.course), selectinload(BestSelling.trip)
         )
@@ -96,29 +103,36 @@ class BestSellingService:
         total = query.count()
         items = query.offset(skip).limit(limit).all()
 
+        items = BEST_SELLING_LIST_ADAPTER.validate_python(items, from_attributes=True)
         return items, total
 
     @staticmethod
-    def get_best_selling_courses(db: Session, limit: int = 10) -> List[BestSelling]:
-        return (
+    def get_best_selling_courses(
+        db: Session, limit: int = 10
+    ) -> List[BestSellingResponse]:
+        items = (
             db.query(BestSelling)
-            .options(selectinload(BestSelling.course))
+            .options(joinedload(BestSelling.course))
             .filter(BestSelling.item_type == ItemType.COURSE)
             .order_by(BestSelling.ranking_position)
             .limit(limit)
             .all()
         )
+        return BEST_SELLING_LIST_ADAPTER.validate_python(items, from_attributes=True)
 
     @staticmethod
-    def get_best_selling_trips(db: Session, limit: int = 10) -> List[BestSelling]:
-        return (
+    def get_best_selling_trips(
+        db: Session, limit: int = 10
+    ) -> List[BestSellingResponse]:
+        items = (
             db.query(BestSelling)
-            .options(selectinload(BestSelling.trip))
+            .options(joinedload(BestSelling.trip))
             .filter(BestSelling.item_type == ItemType.TRIP)
             .order_by(BestSelling.ranking_position)
             .limit(limit)
             .all()
         )
+        return BEST_SELLING_LIST_ADAPTER.validate_python(items, from_attributes=True)
 
     @staticmethod
     def update_best_selling(
@@ -195,15 +209,26 @@ class BestSellingService:
         db: Session, item_type: Optional[ItemType] = None
     ) -> List[BestSelling]:
         """Reorder rankings to ensure sequential numbering (1, 2, 3, ...)"""
-        query = db.query(BestSelling)
+        ranked = select(
+            BestSelling.id,
+            func.row_number()
+            .over(order_by=(BestSelling.ranking_position, BestSelling.id))
+            .label("rn"),
+        )
+        if item_type:
+            ranked = ranked.where(BestSelling.item_type == item_type)
+        ranked = ranked.subquery()
+
+        # Renumber every row in a single UPDATE ... FROM
+        db.execute(
+            update(BestSelling)
+            .where(BestSelling.id == ranked.c.id)
+            .values(ranking_position=ranked.c.rn)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
 
+        query = db.query(BestSelling)
         if item_type:
             query = query.filter(BestSelling.item_type == item_type)
-
-        items = query.order_by(BestSelling.ranking_position).all()
-
-        for index, item in enumerate(items, 1):
-            item.ranking_position = index
-
-        db.commit()
-        return items
+        return query.order_by(BestSelling.ranking_position).all()
@@ -1,15 +1,29 @@
 # app/services/blog.py
+# Expects a request-scoped session from get_db (pooled engine in app.core.database)
 from typing import List, Optional
 
 from fastapi import HTTPException, UploadFile, status
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from sqlalchemy import func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, load_only
 
 from app.models.blog import Blog
-from app.schemas.blog import BlogCreate, BlogUpdate
+from app.schemas.blog import CONTENT_BLOCK_LIST_ADAPTER, BlogCreate, BlogUpdate
 from app.utils.storage import get_public_url, upload_image
 
 
+# Columns BlogListResponse needs; list views never load the heavy content JSON
+_BLOG_LIST_COLUMNS = (
+    Blog.id,
+    Blog.title,
+    Blog.subject,
+    Blog.featured_image,
+    Blog.tags,
+    Blog.created_at,
+    Blog.updated_at,
+)
+
+
 class BlogService:
     """Service class for handling blog operations"""
 
@@ -21,9 +35,22 @@ class BlogService:
         object_key = await upload_image(file, prefix="blogs")
         return get_public_url(object_key)
 
-    def get_all_blogs(self, skip: int = 0, limit: int = 100) -> List[Blog]:
+    def _paginate(
+        self, query, skip: int, limit: int, cursor: Optional[int]
+    ) -> List[Blog]:
+        """Keyset page (newest first, ids below cursor) if given, else offset page"""
+        # Both paths share the id DESC order, so the last id of an offset page
+        # is a valid cursor for the next one
+        query = query.options(load_only(*_BLOG_LIST_COLUMNS)).order_by(Blog.id.desc())
+        if cursor is not None:
+            return query.filter(Blog.id < cursor).limit(limit).all()
+        return query.offset(skip).limit(limit).all()
+
+    def get_all_blogs(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[int] = None
+    ) -> List[Blog]:
         """Get all blog posts with pagination"""
-        return self.db.query(Blog).offset(skip).limit(limit).all()
+        return self._paginate(self.db.query(Blog), skip, limit, cursor)
 
     def get_blog_by_id(self, blog_id: int) -> Blog:
         """Get a blog post by ID"""
@@ -45,65 +72,55 @@ class BlogService:
             )
         return blog
 
-    def get_blogs_by_tag(self, tag: str, skip: int = 0, limit: int = 100) -> List[Blog]:
+    def get_blogs_by_tag(
+        self, tag: str, skip: int = 0, limit: int = 100, cursor: Optional[int] = None
+    ) -> List[Blog]:
         """Get all blog posts with a specific tag"""
         # SQLAlchemy JSON query for MySQL/PostgreSQL
-        return (
-            self.db.query(Blog)
-            .filter(Blog.tags.contains([tag]))
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        query = self.db.query(Blog).filter(Blog.tags.contains([tag]))
+        return self._paginate(query, skip, limit, cursor)
 
     def search_blogs(
-        self, search_query: str, skip: int = 0, limit: int = 100
+        self,
+        search_query: str,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[int] = None,
     ) -> List[Blog]:
         """Search blogs by title, subject, or content"""
-        search_pattern = f"%{search_query}%"
-        return (
-            self.db.query(Blog)
-            .filter(
-                or_(
-                    Blog.title.ilike(search_pattern),
-                    Blog.subject.ilike(search_pattern),
-                )
+        # lower(col) LIKE matches the blog_*_trgm expression indexes
+        search_pattern = f"%{search_query.lower()}%"
+        query = self.db.query(Blog).filter(
+            or_(
+                func.lower(Blog.title).like(search_pattern),
+                func.lower(Blog.subject).like(search_pattern),
             )
-            .offset(skip)
-            .limit(limit)
-            .all()
         )
+        return self._paginate(query, skip, limit, cursor)
 
     def create_blog(self, blog_data: BlogCreate) -> Blog:
         """Create a new blog post"""
-        # Check if blog with same title already exists
-        existing_blog = (
-            self.db.query(Blog).filter(Blog.title == blog_data.title).first()
+        # Convert content blocks to dict format in one pydantic-core call
+        content_data = CONTENT_BLOCK_LIST_ADAPTER.dump_python(
+            blog_data.content, exclude_none=True, mode="json"
         )
-        if existing_blog:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Blog with title '{blog_data.title}' already exists",
-            )
 
-        # Convert content blocks to dict format
-        content_data = [
-            block.model_dump(exclude_none=True) for block in blog_data.content
-        ]
-
-        # Create new blog
-        db_blog = Blog(
-            title=blog_data.title,
-            subject=blog_data.subject,
-            content=content_data,
-            tags=blog_data.tags,
+        # The unique title index decides duplicates; no pre-check SELECT
+        stmt = (
+            pg_insert(Blog)
+            .values(
+                title=blog_data.title,
+                subject=blog_data.subject,
+                content=content_data,
+                tags=blog_data.tags,
+            )
+            .on_conflict_do_nothing(index_elements=[Blog.title])
+            .returning(Blog)
         )
 
         try:
-            self.db.add(db_blog)
+            db_blog = self.db.scalars(stmt).first()
             self.db.commit()
-            self.db.refresh(db_blog)
-            return db_blog
         except Exception as e:
             self.db.rollback()
             raise HTTPException(
@@ -111,6 +128,13 @@ class BlogService:
                 detail=f"Failed to create blog: {str(e)}",
             )
 
+        if db_blog is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Blog with title '{blog_data.title}' already exists",
+            )
+        return db_blog
+
     def update_blog(self, blog_id: int, blog_data: BlogUpdate) -> Blog:
         """Update an existing blog post"""
         blog = self.get_blog_by_id(blog_id)
@@ -131,12 +155,20 @@ class BlogService:
 
         # Convert content blocks if present
         if "content" in update_data and update_data["content"] is not None:
-            update_data["content"] = [
-                block.model_dump(exclude_none=True) for block in blog_data.content
-            ]
+            update_data["content"] = CONTENT_BLOCK_LIST_ADAPTER.dump_python(
+                blog_data.content, exclude_none=True, mode="json"
+            )
 
+        # Only assign fields that actually change; an edit that changes nothing
+        # skips the UPDATE and the refresh entirely
+        changed = False
         for field, value in update_data.items():
-            setattr(blog, field, value)
+            if getattr(blog, field) != value:
+                setattr(blog, field, value)
+                changed = True
+
+        if not changed:
+            return blog
 
         try:
             self.db.commit()
@@ -166,8 +198,7 @@ class BlogService:
 
     def get_all_tags(self) -> List[str]:
         """Get all unique tags from all blogs"""
-        blogs = self.db.query(Blog).all()
-        all_tags = set()
-        for blog in blogs:
-            all_tags.update(blog.tags)
-        return sorted(list(all_tags))
+        # Unnest and de-duplicate in the database instead of loading every blog
+        tag = func.jsonb_array_elements_text(Blog.tags).label("tag")
+        stmt = select(tag).distinct().order_by(tag)
+        return list(self.db.execute(stmt).scalars().all())
@@ -3,12 +3,17 @@ Chatbot Service - AI-powered travel & diving sales chatbot
 Fetches data from database - Supports OpenAI, DeepSeek, and OpenRouter
 """
 
+import json
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 from openai import OpenAI
+from pydantic_core import to_json
 from sqlalchemy.orm import Session
 
+from app.core.cache import get_redis
 from app.core.config import settings
 from app.core.database import SessionLocal
 from app.models.coupon import Coupon
@@ -22,8 +27,18 @@ from app.models.trip import Trip
 # =============================================================================
 
 # Session storage: {session_id: [{"role": "user/assistant", "content": "message", "timestamp": datetime}]}
+# Used only when Redis is unavailable; otherwise sessions live in Redis lists
+# so every worker sees the same conversation.
 sessions: Dict[str, List[Dict[str, Any]]] = {}
 
+# Idle sessions are dropped after this long
+SESSION_MAX_AGE_SECONDS = 24 * 60 * 60
+SESSION_MAX_MESSAGES = 50
+SESSION_KEY_PREFIX = "chatbot:session:"
+
+# {session_id: last activity (monotonic seconds)}, least recently active first
+_session_activity: "OrderedDict[str, float]" = OrderedDict()
+
 
 # =============================================================================
 # AI Client Setup - Multi-Provider Support
@@ -254,31 +269,80 @@ def validate_promo_code_from_db(db: Session, code: str) -> Optional[Dict]:
 # =============================================================================
 
 
+def _touch_session(session_id: str):
+    """Mark a session as just active, moving it to the back of the expiry queue."""
+    _session_activity[session_id] = time.monotonic()
+    _session_activity.move_to_end(session_id)
+
+
+def cleanup_old_sessions(max_age_seconds: int = SESSION_MAX_AGE_SECONDS) -> int:
+    """Drop sessions idle for longer than max_age_seconds; returns how many."""
+    cutoff = time.monotonic() - max_age_seconds
+    removed = 0
+    # Oldest activity is always at the front, so stop at the first live session
+    while _session_activity:
+        session_id, last_active = next(iter(_session_activity.items()))
+        if last_active >= cutoff:
+            break
+        _session_activity.popitem(last=False)
+        sessions.pop(session_id, None)
+        removed += 1
+    return removed
+
+
 def get_or_create_session(session_id: str) -> List[Dict[str, Any]]:
     """Get existing session or create new one."""
     if session_id not in sessions:
+        cleanup_old_sessions()
         sessions[session_id] = []
+        _touch_session(session_id)
     return sessions[session_id]
 
 
-def add_message_to_session(session_id: str, role: str, content: str):
+async def add_message_to_session(session_id: str, role: str, content: str):
     """Add a message to the session history."""
+    timestamp = datetime.now()
+    redis = get_redis()
+    if redis is not None:
+        key = SESSION_KEY_PREFIX + session_id
+        message = to_json({"role": role, "content": content, "timestamp": timestamp})
+        # Append, cap and refresh the idle TTL in one round trip
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.rpush(key, message)
+            pipe.ltrim(key, -SESSION_MAX_MESSAGES, -1)
+            pipe.expire(key, SESSION_MAX_AGE_SECONDS)
+            await pipe.execute()
+        return
+
     session = get_or_create_session(session_id)
-    session.append({"role": role, "content": content, "timestamp": datetime.now()})
+    session.append({"role": role, "content": content, "timestamp": timestamp})
+    _touch_session(session_id)
     # Keep only last 50 messages to prevent memory issues
-    if len(session) > 50:
-        sessions[session_id] = session[-50:]
+    if len(session) > SESSION_MAX_MESSAGES:
+        sessions[session_id] = session[-SESSION_MAX_MESSAGES:]
 
 
-def get_conversation_history(session_id: str) -> List[Dict[str, Any]]:
+async def get_conversation_history(session_id: str) -> List[Dict[str, Any]]:
     """Get conversation history for a session."""
+    redis = get_redis()
+    if redis is not None:
+        raw = await redis.lrange(SESSION_KEY_PREFIX + session_id, 0, -1)
+        history = [json.loads(item) for item in raw]
+        for msg in history:
+            msg["timestamp"] = datetime.fromisoformat(msg["timestamp"])
+        return history
     return sessions.get(session_id, [])
 
 
-def clear_session(session_id: str):
-    """Clear a session from memory."""
+async def clear_session(session_id: str):
+    """Clear a session."""
+    redis = get_redis()
+    if redis is not None:
+        await redis.delete(SESSION_KEY_PREFIX + session_id)
+        return
     if session_id in sessions:
         del sessions[session_id]
+    _session_activity.pop(session_id, None)
 
 
 # =============================================================================
@@ -458,7 +522,7 @@ async def generate_ai_response(session_id: str, user_message: str) -> str:
 
     try:
         # Get conversation history
-        history = get_conversation_history(session_id)
+        history = await get_conversation_history(session_id)
 
         # Build messages for AI
         messages = [{"role": "system", "content": build_system_prompt()}]
@@ -489,8 +553,8 @@ async def generate_ai_response(session_id: str, user_message: str) -> str:
             return "I apologize, but the AI provider is not configured correctly."
 
         # Store the conversation
-        add_message_to_session(session_id, "user", user_message)
-        add_message_to_session(session_id, "assistant", ai_reply)
+        await add_message_to_session(session_id, "user", user_message)
+        await add_message_to_session(session_id, "assistant", ai_reply)
 
         return ai_reply
 
@@ -507,7 +571,7 @@ async def generate_final_response(session_id: str) -> str:
 
     db = get_db()
     try:
-        history = get_conversation_history(session_id)
+        history = await get_conversation_history(session_id)
 
         if not history:
             return "It looks like we haven't chatted yet! How can I help you today?"
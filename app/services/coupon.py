@@ -1,22 +1,49 @@
 # app/services/coupon.py
+# Expects a request-scoped session from get_db (pooled engine in app.core.database)
+import logging
 from datetime import datetime
 from typing import List, Optional
 
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import delete, func, lambda_stmt, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from redis.exceptions import RedisError
 from sqlalchemy.orm import Session
 
+from app.core.cache import get_sync_redis
 from app.core.exception_handler import db_exception_handler
 from app.models.associations import coupon_user_usage
 from app.models.coupon import Coupon
 from app.models.user import User
 from app.schemas.coupon import (
+    COUPON_LIST_ADAPTER,
     ApplyCouponResponse,
     CouponCreate,
     CouponResponse,
     CouponUpdate,
 )
 
+logger = logging.getLogger(__name__)
+
+# Coupon lookups by code are cached in Redis so every worker shares one entry
+# and one invalidation; without Redis every lookup goes to the database
+COUPON_CACHE_TTL = 60
+
+
+def _coupon_cache_key(code: str) -> str:
+    return f"coupon:code:{code}"
+
+
+def invalidate_coupon_cache(code: str) -> None:
+    """Drop the cached lookup for ``code`` (call after the write committed)."""
+    client = get_sync_redis()
+    if client is None:
+        return
+    try:
+        client.delete(_coupon_cache_key(code))
+    except RedisError as e:
+        logger.warning(f"Failed to invalidate coupon cache for {code}: {e}")
+
 
 class CouponServices:
     def __init__(self, db: Session):
@@ -25,38 +52,49 @@ class CouponServices:
     @db_exception_handler
     def create_coupon(self, coupon: CouponCreate) -> CouponResponse:
         """Create a new coupon"""
-        # Check if coupon code already exists
-        stmt = select(Coupon).where(Coupon.code == coupon.code)
-        existing_coupon = self.db.execute(stmt).scalars().first()
+        # The unique code index decides duplicates; no pre-check SELECT
+        stmt = (
+            pg_insert(Coupon)
+            .values(
+                code=coupon.code,
+                activity=coupon.activity,
+                discount_percentage=coupon.discount_percentage,
+                can_used_up_to=coupon.can_used_up_to,
+                user_limit=coupon.user_limit,
+                expire_date=coupon.expire_date,
+            )
+            .on_conflict_do_nothing(index_elements=[Coupon.code])
+            .returning(Coupon)
+        )
+        new_coupon = self.db.scalars(stmt).first()
 
-        if existing_coupon:
+        if new_coupon is None:
             raise HTTPException(status_code=400, detail="Coupon code already exists")
 
-        new_coupon = Coupon(
-            code=coupon.code,
-            activity=coupon.activity,
-            discount_percentage=coupon.discount_percentage,
-            can_used_up_to=coupon.can_used_up_to,
-            user_limit=coupon.user_limit,
-            expire_date=coupon.expire_date,
-        )
-        self.db.add(new_coupon)
         self.db.commit()
-        self.db.refresh(new_coupon)
         return new_coupon
 
     @db_exception_handler
-    def get_all_coupons(self, skip: int = 0, limit: int = 100) -> List[CouponResponse]:
+    def get_all_coupons(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[int] = None
+    ) -> List[CouponResponse]:
         """Get all coupons with pagination"""
-        stmt = select(Coupon).offset(skip).limit(limit)
-        coupons = self.db.execute(stmt).scalars().all()
-        return coupons
+        # Plain column rows validated straight into responses; no ORM instances
+        # Both paths share the id DESC order, so the last id of an offset page
+        # is a valid cursor for the next one
+        stmt = select(*Coupon.__table__.c).order_by(Coupon.id.desc())
+        if cursor is not None:
+            # Keyset page: seek below the last seen id instead of skipping rows
+            stmt = stmt.where(Coupon.id < cursor)
+        else:
+            stmt = stmt.offset(skip)
+        rows = self.db.execute(stmt.limit(limit)).all()
+        return COUPON_LIST_ADAPTER.validate_python(rows, from_attributes=True)
 
     @db_exception_handler
     def get_coupon_by_id(self, coupon_id: int) -> CouponResponse:
         """Get coupon by ID"""
-        stmt = select(Coupon).where(Coupon.id == coupon_id)
-        coupon = self.db.execute(stmt).scalars().first()
+        coupon = self.db.get(Coupon, coupon_id)
 
         if not coupon:
             raise HTTPException(status_code=404, detail="Coupon not found")
@@ -64,19 +102,42 @@ class CouponServices:
         return coupon
 
     @db_exception_handler
-    def get_coupon_by_code(self, code: str) -> Optional[Coupon]:
-        """Get coupon by code"""
-        stmt = select(Coupon).where(Coupon.code == code)
+    def get_coupon_by_code(self, code: str) -> Optional[CouponResponse]:
+        """Get coupon by code (served from the shared Redis coupon cache)"""
+        client = get_sync_redis()
+        if client is not None:
+            try:
+                cached = client.get(_coupon_cache_key(code))
+            except RedisError as e:
+                logger.warning(f"Coupon cache read failed for {code}: {e}")
+                cached = None
+            if cached:
+                return CouponResponse.model_validate_json(cached)
+
+        # lambda_stmt caches the construct by code location; code is bound
+        stmt = lambda_stmt(lambda: select(Coupon).where(Coupon.code == code))
         coupon = self.db.execute(stmt).scalars().first()
-        return coupon
+        if not coupon:
+            return None
+
+        snapshot = CouponResponse.model_validate(coupon)
+        if client is not None:
+            try:
+                client.set(
+                    _coupon_cache_key(code),
+                    snapshot.model_dump_json(),
+                    ex=COUPON_CACHE_TTL,
+                )
+            except RedisError as e:
+                logger.warning(f"Coupon cache write failed for {code}: {e}")
+        return snapshot
 
     @db_exception_handler
     def update_coupon(
         self, coupon_id: int, coupon_data: CouponUpdate
     ) -> CouponResponse:
         """Update a coupon"""
-        stmt = select(Coupon).where(Coupon.id == coupon_id)
-        coupon = self.db.execute(stmt).scalars().first()
+        coupon = self.db.get(Coupon, coupon_id)
 
         if not coupon:
             raise HTTPException(status_code=404, detail="Coupon not found")
@@ -90,62 +151,72 @@ class CouponServices:
                     status_code=400, detail="Coupon code already exists"
                 )
 
+        old_code = coupon.code
         update_data = coupon_data.model_dump(exclude_unset=True)
         for key, value in update_data.items():
             setattr(coupon, key, value)
 
         self.db.commit()
-        self.db.refresh(coupon)
+        invalidate_coupon_cache(old_code)
+        if coupon.code != old_code:
+            invalidate_coupon_cache(coupon.code)
         return coupon
 
     @db_exception_handler
     def delete_coupon(self, coupon_id: int):
         """Delete a coupon"""
-        stmt = select(Coupon).where(Coupon.id == coupon_id)
-        coupon = self.db.execute(stmt).scalars().first()
+        # coupon_user_usage rows go via ON DELETE CASCADE
+        stmt = delete(Coupon).where(Coupon.id == coupon_id).returning(Coupon.code)
+        code = self.db.execute(stmt).scalar_one_or_none()
 
-        if not coupon:
+        if code is None:
             raise HTTPException(status_code=404, detail="Coupon not found")
 
-        self.db.delete(coupon)
         self.db.commit()
+        invalidate_coupon_cache(code)
         return {"detail": "Coupon deleted successfully"}
 
     @db_exception_handler
     def apply_coupon(self, coupon_code: str, user_id: int) -> ApplyCouponResponse:
         """Apply a coupon to a user"""
-        # Get coupon by code
-        coupon = self.get_coupon_by_code(coupon_code)
+        # Coupon, user existence and this user's usage in one round trip; the
+        # outer joins keep the coupon row when the user or usage row is missing
+        stmt = (
+            select(
+                Coupon,
+                User.id.label("user_id"),
+                coupon_user_usage.c.usage_count,
+            )
+            .outerjoin(User, User.id == user_id)
+            .outerjoin(
+                coupon_user_usage,
+                (coupon_user_usage.c.coupon_id == Coupon.id)
+                & (coupon_user_usage.c.user_id == user_id),
+            )
+            .where(Coupon.code == coupon_code)
+        )
+        row = self.db.execute(stmt).first()
 
-        if not coupon:
+        if not row:
             raise HTTPException(status_code=404, detail="Coupon not found")
+        coupon = row.Coupon
 
-        # Check if coupon is valid
-        if not coupon.can_used:
-            if not coupon.is_active:
-                return ApplyCouponResponse(
-                    success=False, message="Coupon is not active"
-                )
-            elif coupon.remaining <= 0:
-                return ApplyCouponResponse(
-                    success=False, message="Coupon usage limit reached"
-                )
-            elif coupon.expire_date and datetime.utcnow() > coupon.expire_date:
-                return ApplyCouponResponse(success=False, message="Coupon has expired")
-
-        # Get user
-        user_stmt = select(User).where(User.id == user_id)
-        user = self.db.execute(user_stmt).scalars().first()
+        # Check if coupon is valid (same rules as Coupon.can_used, with the
+        # clock read once instead of once in can_used and again here)
+        if not coupon.is_active:
+            return ApplyCouponResponse(success=False, message="Coupon is not active")
+        if coupon.used_count >= coupon.can_used_up_to:
+            return ApplyCouponResponse(
+                success=False, message="Coupon usage limit reached"
+            )
+        if coupon.expire_date and datetime.utcnow() > coupon.expire_date:
+            return ApplyCouponResponse(success=False, message="Coupon has expired")
 
-        if not user:
+        if row.user_id is None:
             raise HTTPException(status_code=404, detail="User not found")
 
         # Check if user already used this coupon using the association table
-        usage_stmt = select(coupon_user_usage.c.usage_count).where(
-            coupon_user_usage.c.coupon_id == coupon.id,
-            coupon_user_usage.c.user_id == user.id,
-        )
-        existing_usage_count = self.db.execute(usage_stmt).scalar()
+        existing_usage_count = row.usage_count
 
         if (
             existing_usage_count
@@ -167,67 +238,103 @@ class CouponServices:
         )
 
     @db_exception_handler
-    def consume_coupon(self, coupon_code: str, user_id: int):
+    def consume_coupon(self, coupon_code: str, user_id: int, commit: bool = True):
         """
         Consume a coupon usage for a user.
         Should be called when an invoice is created/paid.
-        """
-        coupon = self.get_coupon_by_code(coupon_code)
-        if not coupon:
-            return  # Should have been validated before
 
-        # Check usage again to be safe (race condition possible but low risk for this app)
-        usage_stmt = select(coupon_user_usage.c.usage_count).where(
-            coupon_user_usage.c.coupon_id == coupon.id,
-            coupon_user_usage.c.user_id == user_id,
-        )
-        existing_usage_count = self.db.execute(usage_stmt).scalar()
-
-        if existing_usage_count:
-            # Update existing usage
-            update_stmt = (
-                coupon_user_usage.update()
-                .where(
-                    coupon_user_usage.c.coupon_id == coupon.id,
-                    coupon_user_usage.c.user_id == user_id,
-                )
-                .values(usage_count=existing_usage_count + 1)
+        The UPDATE itself is the usability check, so concurrent invoices can
+        never push a coupon past its limit. Pass ``commit=False`` to leave the
+        usage in the caller's transaction (e.g. alongside the invoice INSERT);
+        the caller then calls ``invalidate_coupon_cache`` after its commit.
+
+        Raises:
+            HTTPException: 400 if the coupon is inactive, used up, expired or
+                gone, or the user has reached its user_limit
+        """
+        # Bump the coupon counter and learn its id and per-user limit in the
+        # same statement
+        row = self.db.execute(
+            update(Coupon)
+            .where(
+                Coupon.code == coupon_code,
+                Coupon.is_active.is_(True),
+                Coupon.used_count < Coupon.can_used_up_to,
+                or_(
+                    Coupon.expire_date.is_(None),
+                    Coupon.expire_date >= datetime.utcnow(),
+                ),
             )
-            self.db.execute(update_stmt)
-        else:
-            # Insert new usage
-            insert_stmt = coupon_user_usage.insert().values(
-                coupon_id=coupon.id, user_id=user_id, usage_count=1
+            .values(used_count=Coupon.used_count + 1)
+            .returning(Coupon.id, Coupon.user_limit)
+        ).one_or_none()
+        if row is None:
+            raise HTTPException(
+                status_code=400,
+                detail="This coupon code is no longer valid",
             )
-            self.db.execute(insert_stmt)
-
-        coupon.used_count += 1
-        self.db.commit()
-        self.db.refresh(coupon)
+        coupon_id, user_limit = row
+
+        # Atomic per-user upsert on the (coupon_id, user_id) primary key, so two
+        # concurrent invoices can't both take the insert path; the conflict
+        # branch only fires while the user is under user_limit (0 = unlimited)
+        upsert_stmt = (
+            pg_insert(coupon_user_usage)
+            .values(coupon_id=coupon_id, user_id=user_id, usage_count=1)
+            .on_conflict_do_update(
+                index_elements=[
+                    coupon_user_usage.c.coupon_id,
+                    coupon_user_usage.c.user_id,
+                ],
+                set_={"usage_count": coupon_user_usage.c.usage_count + 1},
+                where=(
+                    coupon_user_usage.c.usage_count < user_limit
+                    if user_limit > 0
+                    else None
+                ),
+            )
+            .returning(coupon_user_usage.c.usage_count)
+        )
+        if self.db.execute(upsert_stmt).scalar_one_or_none() is None:
+            # Undo the coupon counter bump along with the rest of the transaction
+            self.db.rollback()
+            raise HTTPException(
+                status_code=400,
+                detail="You have reached the usage limit for this coupon",
+            )
+        if commit:
+            self.db.commit()
+            invalidate_coupon_cache(coupon_code)
 
     @db_exception_handler
     def get_coupon_usage_stats(self) -> dict:
         """Get statistics about coupon usage"""
-        stmt = select(Coupon)
-        coupons = self.db.execute(stmt).scalars().all()
-
-        total_coupons = len(coupons)
-        total_usage = sum(coupon.used_count for coupon in coupons)
-        active_coupons = sum(1 for coupon in coupons if coupon.is_active)
+        totals = self.db.execute(
+            select(
+                func.count(Coupon.id).label("total_coupons"),
+                func.count(Coupon.id)
+                .filter(Coupon.is_active.is_(True))
+                .label("active_coupons"),
+                func.coalesce(func.sum(Coupon.used_count), 0).label("total_usage"),
+            )
+        ).one()
+
+        # Plain column rows for the listing; no ORM objects needed
+        listing_stmt = select(
+            Coupon.id,
+            Coupon.code,
+            Coupon.activity,
+            Coupon.used_count,
+            func.greatest(Coupon.can_used_up_to - Coupon.used_count, 0).label(
+                "remaining"
+            ),
+            Coupon.is_active,
+        )
+        coupons = self.db.execute(listing_stmt).mappings().all()
 
         return {
-            "total_coupons": total_coupons,
-            "active_coupons": active_coupons,
-            "total_usage": total_usage,
-            "coupons": [
-                {
-                    "id": coupon.id,
-                    "code": coupon.code,
-                    "activity": coupon.activity,
-                    "used_count": coupon.used_count,
-                    "remaining": coupon.remaining,
-                    "is_active": coupon.is_active,
-                }
-                for coupon in coupons
-            ],
+            "total_coupons": totals.total_coupons,
+            "active_coupons": totals.active_coupons,
+            "total_usage": totals.total_usage,
+            "coupons": [dict(coupon) for coupon in coupons],
         }
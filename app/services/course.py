@@ -1,12 +1,13 @@
 from typing import List
 
 from fastapi import HTTPException, UploadFile
-from sqlalchemy import and_, select
+from sqlalchemy import and_, delete, exists, insert, select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, selectinload
 
 from app.core.exception_handler import db_exception_handler
 from app.core.telegram import notify_admins
+from app.models.associations import user_course_subscriptions
 from app.models.course import Course
 from app.models.course_content import CourseContent
 from app.models.user import User
@@ -43,24 +44,27 @@ class CourseServices:
 
         new_course = Course(**course_data)
         self.db.add(new_course)
-        self.db.commit()
-        self.db.refresh(new_course)
+        self.db.flush()
 
-        # Add contents if provided
+        # Add contents if provided, as one multi-row INSERT
         if course.contents:
-            for content in course.contents:
-                new_content = CourseContent(
-                    course_id=new_course.id, **content.model_dump()
-                )
-                self.db.add(new_content)
-            self.db.commit()
+            self.db.execute(
+                insert(CourseContent),
+                [
+                    {"course_id": new_course.id, **content.model_dump()}
+                    for content in course.contents
+                ],
+            )
+        # The flush's INSERT ... RETURNING already fetched id and server
+        # defaults (eager_defaults="auto"), so no refresh SELECT is needed
+        self.db.commit()
 
         new_course.images = self._convert_keys_to_urls(new_course.images)
         return new_course
 
     @db_exception_handler
-    def get_all_courses(self):
-        stmt = select(Course)
+    def get_all_courses(self, skip: int = 0, limit: int = 100):
+        stmt = select(Course).order_by(Course.id).offset(skip).limit(limit)
         courses = self.db.execute(stmt).scalars().all()
 
         for course in courses:
@@ -69,9 +73,17 @@ class CourseServices:
         return courses
 
     @db_exception_handler
-    def get_all_courses_with_contents(self):
-        stmt = select(Course).options(joinedload(Course.contents))
-        courses = self.db.execute(stmt).unique().scalars().all()
+    def get_all_courses_with_contents(self, skip: int = 0, limit: int = 100):
+        # selectinload: one IN (...) query for contents instead of repeating
+        # every course row once per content row
+        stmt = (
+            select(Course)
+            .options(selectinload(Course.contents))
+            .order_by(Course.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        courses = self.db.execute(stmt).scalars().all()
 
         for course in courses:
             course.images = self._convert_keys_to_urls(course.images)
@@ -80,8 +92,7 @@ class CourseServices:
 
     @db_exception_handler
     def get_course_by_id(self, id: int):
-        stmt = select(Course).where(Course.id == id)
-        course = self.db.execute(stmt).scalars().first()
+        course = self.db.get(Course, id)
         if course:
             course.images = self._convert_keys_to_urls(course.images)
         return course
@@ -89,7 +100,9 @@ class CourseServices:
     @db_exception_handler
     def get_course_with_contents_by_id(self, id: int):
         stmt = (
-            select(Course).where(Course.id == id).options(joinedload(Course.contents))
+            select(Course)
+            .where(Course.id == id)
+            .options(selectinload(Course.contents))
         )
         course = self.db.execute(stmt).scalars().first()
         if not course:
@@ -100,11 +113,6 @@ class CourseServices:
 
     @db_exception_handler
     def get_course_with_content_by_id_for_user(self, id: int, user: User):
-        user_stmt = select(User).where(User.id == user.id)
-        user_db = self.db.execute(user_stmt).scalars().first()
-        if not user_db:
-            raise HTTPException(404, detail="User not found")
-
         course_stmt = (
             select(Course)
             .join(Course.subscribers)
@@ -114,10 +122,14 @@ class CourseServices:
                     User.id == user.id,
                 )
             )
-            .options(joinedload(Course.contents))
+            .options(selectinload(Course.contents))
         )
         course = self.db.execute(course_stmt).scalars().first()
         if not course:
+            # Only on a miss: tell a missing user apart from a missing subscription
+            user_stmt = select(User.id).where(User.id == user.id)
+            if self.db.execute(user_stmt).first() is None:
+                raise HTTPException(404, detail="User not found")
             raise HTTPException(
                 403, detail="You not subscribed to this course or course not found"
             )
@@ -129,7 +141,7 @@ class CourseServices:
     async def update_course(
         self, id: int, course_update: UpdateCourse, images: List[UploadFile] = None
     ):
-        course_db = self.db.query(Course).filter(Course.id == id).first()
+        course_db = self.db.get(Course, id)
         if not course_db:
             raise HTTPException(status_code=404, detail="Course not found")
 
@@ -158,13 +170,22 @@ class CourseServices:
             setattr(course_db, key, value)
 
         if new_contents_data is not None:
-            self.db.query(CourseContent).filter(CourseContent.course_id == id).delete()
-            for content_item_data in new_contents_data:
-                new_content = CourseContent(**content_item_data, course_id=course_db.id)
-                self.db.add(new_content)
+            # Replace contents with one DELETE and one executemany INSERT
+            self.db.execute(
+                delete(CourseContent)
+                .where(CourseContent.course_id == id)
+                .execution_options(synchronize_session=False)
+            )
+            if new_contents_data:
+                self.db.execute(
+                    insert(CourseContent),
+                    [
+                        {**content_item_data, "course_id": course_db.id}
+                        for content_item_data in new_contents_data
+                    ],
+                )
 
         self.db.commit()
-        self.db.refresh(course_db)
 
         course_db.images = self._convert_keys_to_urls(course_db.images)
         return course_db
@@ -172,21 +193,20 @@ class CourseServices:
     @db_exception_handler
     def delete_course(self, id: int):
         try:
-            stmt = select(Course).where(Course.id == id)
-            course = self.db.execute(stmt).scalars().first()
-            if course:
-                if course.images:
-                    for key in course.images:
-                        try:
-                            delete_file(key)
-                        except Exception as e:
-                            print(f"Failed to delete image {key}: {e}")
-
-                self.db.delete(course)
-                self.db.commit()
-                return {"success": True, "message": "Course deleted successfully"}
-            else:
+            # One DELETE ... RETURNING; course_contents go via ON DELETE CASCADE
+            stmt = delete(Course).where(Course.id == id).returning(Course.images)
+            row = self.db.execute(stmt).first()
+            if row is None:
                 raise HTTPException(404, detail="Course not found")
+            self.db.commit()
+
+            for key in row.images or []:
+                try:
+                    delete_file(key)
+                except Exception as e:
+                    print(f"Failed to delete image {key}: {e}")
+
+            return {"success": True, "message": "Course deleted successfully"}
         except SQLAlchemyError as e:
             self.db.rollback()
             return {"success": False, "message": f"Error deleting course: {str(e)}"}
@@ -217,33 +237,58 @@ class CourseServices:
         if not course:
             raise HTTPException(404, detail="Course not found")
 
-        for content in contents:
-            new_content = CourseContent(course_id=course_id, **content.model_dump())
-            self.db.add(new_content)
+        if contents:
+            self.db.execute(
+                insert(CourseContent),
+                [
+                    {"course_id": course_id, **content.model_dump()}
+                    for content in contents
+                ],
+            )
         self.db.commit()
         return {"success": True, "message": "Contents added successfully"}
 
     @db_exception_handler
     def enroll_user_in_course(self, user_id: int, course_id: int):
         """Subscribes a user to a specific course."""
-        user = self.db.query(User).filter(User.id == user_id).first()
-        if not user:
+        # User, course and existing subscription in one round trip, without
+        # materializing user.subscribed_courses
+        checks = self.db.execute(
+            select(
+                exists().where(User.id == user_id).label("user_exists"),
+                select(Course.name)
+                .where(Course.id == course_id)
+                .scalar_subquery()
+                .label("course_name"),
+                exists()
+                .where(
+                    user_course_subscriptions.c.user_id == user_id,
+                    user_course_subscriptions.c.course_id == course_id,
+                )
+                .label("enrolled"),
+            )
+        ).one()
+
+        if not checks.user_exists:
             raise HTTPException(status_code=404, detail="User not found")
 
-        course = self.db.query(Course).filter(Course.id == course_id).first()
-        if not course:
+        if checks.course_name is None:
             raise HTTPException(status_code=404, detail="Course not found")
 
-        if course in user.subscribed_courses:
+        if checks.enrolled:
             raise HTTPException(
                 status_code=400,
                 detail="User is already enrolled in this course",
             )
 
-        user.subscribed_courses.append(course)
+        self.db.execute(
+            insert(user_course_subscriptions).values(
+                user_id=user_id, course_id=course_id
+            )
+        )
         self.db.commit()
 
-        return {"message": f"Successfully enrolled in {course.name}"}
+        return {"message": f"Successfully enrolled in {checks.course_name}"}
 
     @db_exception_handler
     def send_course_inquiry(self, inquiry_data: dict):
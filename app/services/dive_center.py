@@ -1,5 +1,5 @@
 from fastapi import HTTPException, UploadFile, status
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
 from app.models.dive_center import DiveCenter
@@ -50,20 +50,26 @@ class DiveCenterService:
             center_data["video"] = video
 
         new_center = DiveCenter(**center_data)
+        # id and server defaults come back on the INSERT's RETURNING clause
         self.db.add(new_center)
         self.db.commit()
-        self.db.refresh(new_center)
         return new_center
 
     def get_dive_center_by_id(self, dive_center_id: int) -> DiveCenter:
-        stmt = select(DiveCenter).where(DiveCenter.id == dive_center_id)
-        result = self.db.execute(stmt).scalar_one_or_none()
+        result = self.db.get(DiveCenter, dive_center_id)
         if not result:
             raise HTTPException(status_code=404, detail="Dive center not found")
         return result
 
-    def get_all_dive_centers(self) -> list[DiveCenter]:
-        stmt = select(DiveCenter).order_by(DiveCenter.created_at.desc())
+    def get_all_dive_centers(
+        self, skip: int = 0, limit: int = 100
+    ) -> list[DiveCenter]:
+        stmt = (
+            select(DiveCenter)
+            .order_by(DiveCenter.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
         return self.db.execute(stmt).scalars().all()
 
     async def update_dive_center(
@@ -95,14 +101,25 @@ class DiveCenterService:
             except Exception as e:
                 raise HTTPException(status_code=500, detail=f"Video upload failed: {e}")
 
-        for key, value in data.model_dump(exclude_unset=True).items():
+        updates = data.model_dump(exclude_unset=True)
+        if updates.get("working_hours"):
+            # Only the days sent are replaced; the rest keep their stored hours
+            updates["working_hours"] = {
+                **(center.working_hours or {}),
+                **updates["working_hours"],
+            }
+        for key, value in updates.items():
             setattr(center, key, value)
 
         self.db.commit()
-        self.db.refresh(center)
         return center
 
     def delete_dive_center(self, dive_center_id: int) -> None:
-        center = self.get_dive_center_by_id(dive_center_id)
-        self.db.delete(center)
+        stmt = (
+            delete(DiveCenter)
+            .where(DiveCenter.id == dive_center_id)
+            .returning(DiveCenter.id)
+        )
+        if self.db.execute(stmt).scalar_one_or_none() is None:
+            raise HTTPException(status_code=404, detail="Dive center not found")
         self.db.commit()
@@ -1,3 +1,4 @@
+import math
 from typing import Optional
 
 from fastapi import HTTPException, status
@@ -59,8 +60,6 @@ class FeeCalculator:
             .all()
         )
 
-        mandatory_total = 0.0
-        optional_total = 0.0
         mandatory_lines = []
         optional_lines = []
 
@@ -73,13 +72,15 @@ class FeeCalculator:
 
             if fee.is_optional:
                 if fee.id in selected_optional_fee_ids:
-                    optional_total += amount
                     optional_lines.append({"name": fee.name, "amount": amount})
                 # not selected -> skip entirely, no charge
             else:
-                mandatory_total += amount
                 mandatory_lines.append({"name": fee.name, "amount": amount})
 
+        # fsum keeps the line totals exact instead of accumulating rounding drift
+        mandatory_total = math.fsum(line["amount"] for line in mandatory_lines)
+        optional_total = math.fsum(line["amount"] for line in optional_lines)
+
         # Validate that selected optional fee ids actually belong to this trip
         valid_optional_ids = {f.id for f in fees if f.is_optional}
         invalid_ids = selected_optional_fee_ids - valid_optional_ids
@@ -1,33 +1,93 @@
+import asyncio
+import base64
+import binascii
 import logging
+import time
+from datetime import datetime
 from typing import List, Optional, Tuple
 
 from fastapi import HTTPException, UploadFile, status
-from sqlalchemy import func
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, func, tuple_
 from sqlalchemy.orm import Session
 
 from app.models.gallery import Gallery
 from app.schemas.gallery import ImageCreate, ImageUpdate
-from app.utils.storage import delete_file, get_public_url, upload_image
+from app.utils.storage import (
+    delete_file,
+    delete_files,
+    get_public_url,
+    new_object_key,
+    upload_image,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def encode_gallery_cursor(image: Gallery) -> str:
+    """Opaque keyset cursor carrying the (created_at, id) of ``image``."""
+    raw = f"{image.created_at.isoformat()}|{image.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_gallery_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Inverse of ``encode_gallery_cursor``; 400 on anything malformed."""
+    try:
+        created_at, _, image_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().rpartition("|")
+        )
+        return datetime.fromisoformat(created_at), int(image_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+
 class ImageService:
     """Service class for handling gallery image operations via S3."""
 
+    COUNT_CACHE_TTL = 30.0  # seconds
+
+    def __init__(self):
+        # (expires_at, total) for get_images; dropped on create/delete
+        self._count_cache: Optional[Tuple[float, int]] = None
+
+    def _invalidate_count(self) -> None:
+        self._count_cache = None
+
     async def create_image(self, db: Session, file: UploadFile) -> Gallery:
         """Upload image to S3 and create database record."""
         try:
-            object_key = await upload_image(file, prefix="gallery")
-            image_url = get_public_url(object_key)
-
+            # The row only needs the key, so reserve it and run the S3 upload
+            # and the INSERT concurrently; commit only once both succeeded
+            object_key = new_object_key("gallery", file.filename or "")
             db_image = Gallery(
                 name=file.filename or object_key,
-                url=image_url,
+                url=get_public_url(object_key),
+                object_key=object_key,
             )
-            db.add(db_image)
+
+            def _insert_row() -> None:
+                # id and created_at come back on the INSERT's RETURNING clause
+                db.add(db_image)
+                db.flush()
+
+            uploaded, inserted = await asyncio.gather(
+                upload_image(file, prefix="gallery", object_key=object_key),
+                run_in_threadpool(_insert_row),
+                return_exceptions=True,
+            )
+            if isinstance(uploaded, BaseException) or isinstance(
+                inserted, BaseException
+            ):
+                db.rollback()
+                if not isinstance(uploaded, BaseException):
+                    await run_in_threadpool(delete_file, object_key)
+                    raise inserted
+                raise uploaded
+
             db.commit()
-            db.refresh(db_image)
+            self._invalidate_count()
             return db_image
 
         except HTTPException:
@@ -40,28 +100,45 @@ class ImageService:
             )
 
     def get_images(
-        self, db: Session, skip: int = 0, limit: int = 100
-    ) -> Tuple[List[Gallery], int]:
-        """Get all images with pagination and total count."""
-        total = db.query(func.count(Gallery.id)).scalar()
-        images = (
-            db.query(Gallery)
-            .order_by(Gallery.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
-        return images, total
+        self, db: Session, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> Tuple[List[Gallery], int, Optional[str]]:
+        """Get images with pagination, total count and the next page's cursor.
+
+        With ``cursor`` (from a previous page's ``next_cursor``) the page is a
+        keyset seek on (created_at, id) and ``skip`` is ignored. The cursor
+        carries both values, so it stays valid if that image is deleted.
+        """
+        now = time.monotonic()
+        if self._count_cache and self._count_cache[0] > now:
+            total = self._count_cache[1]
+        else:
+            total = db.query(func.count(Gallery.id)).scalar()
+            self._count_cache = (now + self.COUNT_CACHE_TTL, total)
+        query = db.query(Gallery).order_by(Gallery.created_at.desc(), Gallery.id.desc())
+        if cursor is not None:
+            # (created_at, id) row comparison; served by the
+            # gallery_created_at_id_desc index
+            created_at, image_id = decode_gallery_cursor(cursor)
+            query = query.filter(
+                tuple_(Gallery.created_at, Gallery.id) < (created_at, image_id)
+            )
+        else:
+            query = query.offset(skip)
+        images = query.limit(limit).all()
+        next_cursor = None
+        if len(images) == limit:
+            next_cursor = encode_gallery_cursor(images[-1])
+        return images, total, next_cursor
 
     def get_image(self, db: Session, image_id: int) -> Optional[Gallery]:
         """Get specific image by ID."""
-        return db.query(Gallery).filter(Gallery.id == image_id).first()
+        return db.get(Gallery, image_id)
 
     def update_image(
         self, db: Session, image_id: int, image_update: ImageUpdate
     ) -> Optional[Gallery]:
         """Update image metadata."""
-        db_image = db.query(Gallery).filter(Gallery.id == image_id).first()
+        db_image = db.get(Gallery, image_id)
         if not db_image:
             return None
 
@@ -70,7 +147,6 @@ class ImageService:
                 db_image.name = image_update.name
 
             db.commit()
-            db.refresh(db_image)
             return db_image
 
         except Exception as e:
@@ -82,17 +158,21 @@ class ImageService:
 
     def delete_image(self, db: Session, image_id: int) -> bool:
         """Delete image from S3 and database."""
-        db_image = db.query(Gallery).filter(Gallery.id == image_id).first()
-        if not db_image:
-            return False
-
         try:
-            # Delete from database first
-            db.delete(db_image)
+            # Delete from database first, in one DELETE ... RETURNING
+            stmt = (
+                delete(Gallery)
+                .where(Gallery.id == image_id)
+                .returning(Gallery.object_key, Gallery.url)
+            )
+            row = db.execute(stmt).first()
+            if row is None:
+                return False
             db.commit()
+            self._invalidate_count()
 
             # Delete from S3
-            delete_file(db_image.url)
+            delete_file(row.object_key or row.url)
             return True
 
         except Exception as e:
@@ -105,21 +185,24 @@ class ImageService:
     def delete_all_images(self, db: Session) -> int:
         """Delete all images from S3 and database."""
         try:
-            images = db.query(Gallery).all()
-            deleted_count = len(images)
-
-            # Delete files from S3
-            for image in images:
-                try:
-                    delete_file(image.url)
-                except Exception as e:
-                    logger.warning(f"Failed to delete S3 object for {image.url}: {e}")
-
-            # Delete all records from database
-            db.query(Gallery).delete()
+            # Delete all records from database first; one bulk DELETE hands
+            # back just the keys, no ORM rows are loaded
+            stmt = (
+                delete(Gallery)
+                .returning(Gallery.object_key, Gallery.url)
+                .execution_options(synchronize_session=False)
+            )
+            rows = db.execute(stmt).all()
             db.commit()
+            self._invalidate_count()
+
+            # Delete files from S3, up to 1000 keys per request
+            try:
+                delete_files([row.object_key or row.url for row in rows])
+            except Exception as e:
+                logger.warning(f"Failed to delete S3 objects for gallery: {e}")
 
-            return deleted_count
+            return len(rows)
 
         except Exception as e:
             db.rollback()
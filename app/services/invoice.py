@@ -13,6 +13,7 @@ from app.models.invoice import Invoice
 # --- IMPORT THE NEW SCHEMA ---
 from app.schemas.invoice import UserInvoiceSummaryResponse  # <-- NEW
 from app.schemas.invoice import (
+    EasyKashCallbackPayload,
     InvoiceActivityBreakdown,
     InvoiceCreate,
     InvoiceCreateResponse,
@@ -21,13 +22,14 @@ from app.schemas.invoice import (
     InvoiceResponse,
     InvoiceSummaryResponse,
     InvoiceTypeBreakdown,
+    InvoiceStatus,
     InvoiceUpdate,
     MonthlyInvoiceAnalytics,
     TopCustomerResponse,
 )
 from app.services.activity_availability import ActivityAvailabilityService
 from app.services.bundle import BundleServices
-from app.services.coupon import CouponServices
+from app.services.coupon import CouponServices, invalidate_coupon_cache
 from app.services.fee_calculator import FeeCalculator
 from app.services.price_calculator import PriceCalculator
 from app.utils.currency_converter import CurrencyConverter
@@ -281,6 +283,16 @@ class InvoiceService:
         # This stores how many EGP = 1 unit of invoice currency
         convert_rate = CurrencyConverter.get_rate_to_egp_sync(invoice_data.currency)
 
+        # Consume the coupon before any payment link exists. The guarded UPDATE
+        # is the authoritative check and commits together with the invoice, so
+        # an exhausted or deactivated coupon rejects the booking up front; if a
+        # later step fails, the uncommitted usage is rolled back with the session
+        if coupon_obj and invoice_data.coupon_code:
+            coupon_service = CouponServices(db)
+            coupon_service.consume_coupon(
+                invoice_data.coupon_code, user_id, commit=False
+            )
+
         # Step 4: Handle online vs cash payment setup
         if invoice_data.invoice_type == "online":
             payment_payload = invoice_data.model_dump()
@@ -336,13 +348,10 @@ class InvoiceService:
         db.add(new_invoice)
         db.commit()
         db.refresh(new_invoice)
-
-        # Step 6: Consume the coupon if one was used
         if coupon_obj and invoice_data.coupon_code:
-            coupon_service = CouponServices(db)
-            coupon_service.consume_coupon(invoice_data.coupon_code, user_id)
+            invalidate_coupon_cache(invoice_data.coupon_code)
 
-        # Step 7: Enhanced Telegram Notification
+        # Step 6: Enhanced Telegram Notification
         activity_details_str = ""
         if new_invoice.activity_details:
             for detail in new_invoice.activity_details:
@@ -753,7 +762,7 @@ class InvoiceService:
 
     @staticmethod
     def update_payment_status_public(
-        db: Session, customer_reference: str, payment_status: str
+        db: Session, customer_reference: str, payment_status: InvoiceStatus
     ) -> InvoiceResponse:
         """
         Public method to update invoice payment status using customer_reference.
@@ -846,7 +855,14 @@ class InvoiceService:
         for key, value in update_data.items():
             if key == "activity_details" and value:
                 # Pydantic models in a list need to be converted to dicts
-                setattr(invoice, key, [item.model_dump(mode="json") for item in value])
+                setattr(
+                    invoice,
+                    key,
+                    [
+                        item.model_dump(mode="json")
+                        for item in invoice_data.activity_details
+                    ],
+                )
             else:
                 setattr(invoice, key, value)
 
@@ -882,21 +898,21 @@ class InvoiceService:
         return {"message": "Invoice deleted"}
 
     @staticmethod
-    def process_payment_callback(db: Session, payload: dict):
+    def process_payment_callback(db: Session, payload: EasyKashCallbackPayload):
         """
         Updates an invoice based on a verified payment callback.
         """
         # --- 1. Find invoice ---
         invoice = (
             db.query(Invoice)
-            .filter(Invoice.customer_reference == payload.get("customerReference"))
+            .filter(Invoice.customer_reference == payload.customerReference)
             .first()
         )
 
         if not invoice:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Invoice with customer reference {payload.get('customerReference')} not found.",
+                detail=f"Invoice with customer reference {payload.customerReference} not found.",
             )
 
         # --- 2. Idempotency ---
@@ -904,23 +920,23 @@ class InvoiceService:
             return {"status": "success", "message": "Invoice already marked as paid."}
 
         # --- 3. Validate status ---
-        incoming_status = payload.get("status", "").upper()
+        incoming_status = str(payload.status).upper()
         VALID_CALLBACK_STATUSES = ["PAID", "FAILED", "CANCELLED", "EXPIRED"]
 
         if incoming_status not in VALID_CALLBACK_STATUSES:
             print(
-                f"Received unknown status '{payload.get('status')}' "
-                f"for invoice ref {payload.get('customerReference')}."
+                f"Received unknown status '{payload.status}' "
+                f"for invoice ref {payload.customerReference}."
             )
             return {
                 "status": "noop",
-                "message": f"Received unhandled status '{payload.get('status')}'. Invoice not updated.",
+                "message": f"Received unhandled status '{payload.status}'. Invoice not updated.",
             }
 
         # --- 4. Update invoice ---
         invoice.status = incoming_status
-        invoice.easykash_reference = payload.get("easykashRef")
-        invoice.payment_method = payload.get("paymentMethod")
+        invoice.easykash_reference = payload.easykashRef
+        invoice.payment_method = payload.PaymentMethod
 
         db.commit()
         db.refresh(invoice)
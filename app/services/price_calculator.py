@@ -10,9 +10,10 @@ from typing import Optional, Tuple
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.models.coupon import Coupon
 from app.models.course import Course
 from app.models.trip import Trip
+from app.schemas.coupon import CouponResponse
+from app.services.coupon import CouponServices
 
 
 class PriceCalculator:
@@ -108,7 +109,7 @@ class PriceCalculator:
         coupon_obj = None
 
         if coupon_code:
-            coupon_obj = db.query(Coupon).filter(Coupon.code == coupon_code).first()
+            coupon_obj = CouponServices(db).get_coupon_by_code(coupon_code)
 
             if not coupon_obj:
                 raise HTTPException(
@@ -214,7 +215,7 @@ class PriceCalculator:
         coupon_obj = None
 
         if coupon_code:
-            coupon_obj = db.query(Coupon).filter(Coupon.code == coupon_code).first()
+            coupon_obj = CouponServices(db).get_coupon_by_code(coupon_code)
 
             if not coupon_obj:
                 raise HTTPException(
@@ -255,7 +256,9 @@ class PriceCalculator:
 
     @staticmethod
     def _validate_coupon(
-        coupon: Coupon, user_id: Optional[int] = None, activity_type: str = "all"
+        coupon: CouponResponse,
+        user_id: Optional[int] = None,
+        activity_type: str = "all",
     ) -> None:
         """
         Validate that a coupon is applicable.
@@ -11,6 +11,7 @@ from app.schemas.public_notification import (
 )
 from app.schemas.public_notification import (
     PublicNotificationCreate,
+    PublicNotificationList,
     PublicNotificationUpdate,
 )
 
@@ -40,7 +41,9 @@ class PublicNotificationServices:
             .limit(limit)
         )
         notifications = self.db.execute(stmt).scalars().all()
-        return [PublicNotificationSchema.model_validate(n) for n in notifications]
+        return PublicNotificationList.model_validate(
+            notifications, from_attributes=True
+        ).root
 
     @db_exception_handler
     def get_notification_by_id(self, id: int) -> PublicNotificationSchema:
@@ -36,7 +36,6 @@ class UserServices:
             for field, value in data.items():
                 setattr(updated_user, field, value)
             self.db.commit()
-            self.db.refresh(updated_user)
             return {
                 "success": True,
                 "message": "User Updated successfuly",
@@ -55,7 +54,6 @@ class UserServices:
             updated_user.password = hash_password(user.new_password)
             updated_user.last_login = datetime.now(timezone.utc)
             self.db.commit()
-            self.db.refresh(updated_user)
             return {
                 "success": True,
                 "message": "Password Updated successfuly",
@@ -12,6 +12,17 @@ from app.core.config import settings
 private_key = settings.EASYKASH_PRIVATE_KEY
 secret_key = settings.EASYKASH_SECRET_KEY
 
+# Callback fields covered by the signatureHash, in concatenation order
+SIGNATURE_FIELDS = (
+    "ProductCode",
+    "Amount",
+    "ProductType",
+    "PaymentMethod",
+    "status",
+    "easykashRef",
+    "customerReference",
+)
+
 
 class EasyKash:
     def __init__(self, private_key, secret_key):
@@ -85,38 +96,19 @@ class EasyKash:
             }
 
     def verify_callback(self, payload: dict, secret_key: str) -> bool:
-        # Extract data from the payload
-        product_code = payload.get("ProductCode")
-        amount = payload.get("Amount")
-        product_type = payload.get("ProductType")
-        payment_method = payload.get("PaymentMethod")
-        status = payload.get("status")
-        easykash_ref = payload.get("easykashRef")
-        customer_reference = payload.get("customerReference")
-        signature_hash = payload.get("signatureHash")
-
-        # Prepare data for verification (concatenated string)
-        data_to_secure = [
-            str(product_code),
-            str(amount),
-            str(product_type),
-            str(payment_method),
-            str(status),
-            str(easykash_ref),
-            str(customer_reference),
-        ]
-        data_str = "".join(data_to_secure)
+        # Concatenate the signed fields straight from the raw callback dict
+        data_str = "".join(str(payload.get(field)) for field in SIGNATURE_FIELDS)
 
         # Generate HMAC SHA-512 hash
         calculated_signature = hmac.new(
             secret_key.encode("utf-8"), data_str.encode("utf-8"), hashlib.sha512
         ).hexdigest()
 
-        print("Concatenated data =", data_str)
-        print("Calculated signature =", calculated_signature)
-        print("Received signature   =", signature_hash)
-
-        return calculated_signature == signature_hash
+        # Compare bytes: compare_digest raises TypeError on non-ASCII str input
+        return hmac.compare_digest(
+            calculated_signature.encode(),
+            str(payload.get("signatureHash", "")).encode(),
+        )
 
     # --- 3. Example Verification Function ---
 
@@ -1,5 +1,7 @@
 from datetime import datetime
-import json
+from typing import Any
+
+from pydantic_core import to_json
 
 def datetime_encoder(obj):
     """Custom JSON encoder for datetime objects"""
@@ -9,4 +11,9 @@ def datetime_encoder(obj):
 
 def json_dumps(obj):
     """Helper function to dump JSON with datetime support"""
-    return json.dumps(obj, default=datetime_encoder)
\ No newline at end of file
+    # pydantic-core's Rust encoder handles datetime natively
+    return to_json(obj).decode()
+
+def sse_event(payload: Any) -> bytes:
+    """Encode ``payload`` as a single server-sent ``data:`` event."""
+    return b"data: " + to_json(payload) + b"\n\n"
@@ -9,12 +9,12 @@ the application.
 import io
 import logging
 import uuid
-from pathlib import Path
 from typing import Optional
 
 import boto3
 from botocore.exceptions import BotoCoreError, ClientError
 from fastapi import HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from PIL import Image
 
 from app.core.config import settings
@@ -24,11 +24,30 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
-ALLOWED_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp"}
-ALLOWED_VIDEO_EXTENSIONS = {".mp4", ".mov", ".avi", ".mkv", ".webm"}
+ALLOWED_IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp"})
+ALLOWED_VIDEO_EXTENSIONS = frozenset({".mp4", ".mov", ".avi", ".mkv", ".webm"})
+
+# Prebuilt "not allowed" messages
+_IMAGE_TYPE_ERROR = (
+    f"File type not allowed. Allowed: {', '.join(sorted(ALLOWED_IMAGE_EXTENSIONS))}"
+)
+_VIDEO_TYPE_ERROR = (
+    f"File type not allowed. Allowed: {', '.join(sorted(ALLOWED_VIDEO_EXTENSIONS))}"
+)
+
+S3_DELETE_BATCH_SIZE = 1000  # DeleteObjects accepts at most 1000 keys
 
 MAX_IMAGE_SIZE = 10 * 1024 * 1024  # 10 MB
 MAX_VIDEO_SIZE = 100 * 1024 * 1024  # 100 MB
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+# Leading magic bytes of the accepted image formats (WEBP is checked separately)
+_IMAGE_MAGIC = (
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"\x89PNG\r\n\x1a\n", ".png"),
+    (b"GIF8", ".gif"),
+    (b"BM", ".bmp"),
+)
 
 # Content-type mapping for common extensions
 CONTENT_TYPE_MAP = {
@@ -147,6 +166,33 @@ def _upload_bytes_to_s3(
         raise HTTPException(status_code=500, detail=f"Storage upload failed: {exc}")
 
 
+def _upload_fileobj_to_s3(
+    fileobj,
+    object_key: str,
+    content_type: str = "application/octet-stream",
+) -> str:
+    """
+    Stream a file object to S3 and return the public URL.
+
+    boto3 reads the file in parts, so the upload is never held in memory as
+    one bytes object. Blocking; call through ``run_in_threadpool``.
+    """
+    client = get_s3_client()
+    try:
+        fileobj.seek(0)
+        client.upload_fileobj(
+            fileobj,
+            settings.S3_BUCKET_NAME,
+            object_key,
+            ExtraArgs={"ContentType": content_type},
+        )
+        logger.debug(f"Streamed {object_key} to S3")
+        return get_public_url(object_key)
+    except (ClientError, BotoCoreError) as exc:
+        logger.error(f"S3 upload failed for {object_key}: {exc}")
+        raise HTTPException(status_code=500, detail=f"Storage upload failed: {exc}")
+
+
 def delete_from_s3(object_key: str) -> bool:
     """
     Delete an object from S3.
@@ -167,9 +213,41 @@ def delete_from_s3(object_key: str) -> bool:
         return False
 
 
+def delete_many_from_s3(object_keys: list[str]) -> int:
+    """
+    Delete objects from S3 in DeleteObjects batches of up to 1000 keys.
+
+    Returns:
+        Number of keys S3 reported as deleted.
+    """
+    client = get_s3_client()
+    deleted = 0
+    for start in range(0, len(object_keys), S3_DELETE_BATCH_SIZE):
+        batch = object_keys[start : start + S3_DELETE_BATCH_SIZE]
+        try:
+            response = client.delete_objects(
+                Bucket=settings.S3_BUCKET_NAME,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+        except (ClientError, BotoCoreError) as exc:
+            logger.error(f"S3 batch delete failed for {len(batch)} keys: {exc}")
+            continue
+        errors = response.get("Errors", [])
+        for error in errors:
+            logger.warning(f"S3 delete failed for {error.get('Key')}: {error}")
+        deleted += len(batch) - len(errors)
+    return deleted
+
+
 # ---------------------------------------------------------------------------
 # Filename / key generation
 # ---------------------------------------------------------------------------
+def _file_ext(filename: str) -> str:
+    """Lower-cased extension with its dot (``.jpg``), or "" if there is none."""
+    stem, dot, ext = filename.rpartition(".")
+    return f".{ext.lower()}" if dot and stem else ""
+
+
 def _generate_object_key(prefix: str, original_filename: str) -> tuple[str, str]:
     """
     Generate a unique S3 object key.
@@ -181,12 +259,17 @@ def _generate_object_key(prefix: str, original_filename: str) -> tuple[str, str]
     Returns:
         Tuple of (object_key, file_extension).
     """
-    ext = Path(original_filename).suffix.lower()
+    ext = _file_ext(original_filename)
     unique_id = str(uuid.uuid4())
     object_key = f"{prefix}/{unique_id}{ext}"
     return object_key, ext
 
 
+def new_object_key(prefix: str, original_filename: str) -> str:
+    """Reserve an object key ahead of ``upload_image(..., object_key=...)``."""
+    return _generate_object_key(prefix, original_filename)[0]
+
+
 # ---------------------------------------------------------------------------
 # Extract object key from URL
 # ---------------------------------------------------------------------------
@@ -225,25 +308,81 @@ def extract_object_key_from_url(url: str) -> Optional[str]:
     return None
 
 
+# ---------------------------------------------------------------------------
+# Upload reading
+# ---------------------------------------------------------------------------
+async def _read_upload(file: UploadFile, max_size: int) -> bytes:
+    """
+    Read an upload in fixed-size chunks, rejecting it as soon as it exceeds
+    ``max_size`` instead of after the whole body has been buffered.
+    """
+    buffer = bytearray()
+    await file.seek(0)
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        if len(buffer) + len(chunk) > max_size:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large. Maximum size: {max_size // (1024 * 1024)}MB",
+            )
+        buffer += chunk
+    return bytes(buffer)
+
+
+def _check_upload_size(file: UploadFile, max_size: int) -> bool:
+    """
+    Reject an upload whose known size exceeds ``max_size``.
+
+    Returns False when the size is unknown, in which case the caller falls
+    back to the chunked ``_read_upload`` path.
+    """
+    if file.size is None:
+        return False
+    if file.size > max_size:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum size: {max_size // (1024 * 1024)}MB",
+        )
+    return True
+
+
 # ---------------------------------------------------------------------------
 # Image upload
 # ---------------------------------------------------------------------------
-def _validate_image_bytes(data: bytes) -> None:
-    """Validate that bytes represent a real image using PIL."""
+def _sniff_image_ext(header: bytes) -> str:
+    """Return the image extension matching the file's magic bytes, or raise 400."""
+    for magic, ext in _IMAGE_MAGIC:
+        if header.startswith(magic):
+            return ext
+    if header[0:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return ".webp"
+    raise HTTPException(status_code=400, detail="File content is not a supported image")
+
+
+def _validate_image_file(fileobj) -> None:
+    """Validate that a file object holds a real image using PIL."""
     try:
-        with Image.open(io.BytesIO(data)) as img:
+        fileobj.seek(0)
+        with Image.open(fileobj) as img:
             img.verify()
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid image file or corrupted image")
 
 
-async def upload_image(file: UploadFile, prefix: str = "images") -> str:
+def _validate_image_bytes(data: bytes) -> None:
+    """Validate that bytes represent a real image using PIL."""
+    _validate_image_file(io.BytesIO(data))
+
+
+async def upload_image(
+    file: UploadFile, prefix: str = "images", object_key: Optional[str] = None
+) -> str:
     """
     Upload a single image to S3.
 
     Args:
         file: FastAPI UploadFile.
         prefix: S3 key prefix (default ``images``).
+        object_key: Key from ``new_object_key``; generated here if omitted.
 
     Returns:
         The unique filename (object key) stored in S3, e.g. ``images/uuid.jpg``.
@@ -251,27 +390,35 @@ async def upload_image(file: UploadFile, prefix: str = "images") -> str:
     if not file or not file.filename:
         raise HTTPException(status_code=400, detail="No file provided")
 
-    ext = Path(file.filename).suffix.lower()
+    ext = _file_ext(file.filename)
     if ext not in ALLOWED_IMAGE_EXTENSIONS:
         raise HTTPException(
             status_code=400,
-            detail=f"File type not allowed. Allowed: {', '.join(ALLOWED_IMAGE_EXTENSIONS)}",
+            detail=_IMAGE_TYPE_ERROR,
         )
 
-    contents = await file.read()
+    # Trust the content, not the client's name: content type follows the magic bytes
+    header = await file.read(32)
+    await file.seek(0)
+    detected_ext = _sniff_image_ext(header)
 
-    if len(contents) > MAX_IMAGE_SIZE:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File too large. Maximum size: {MAX_IMAGE_SIZE // (1024 * 1024)}MB",
-        )
-
-    _validate_image_bytes(contents)
+    if object_key is None:
+        object_key, _ = _generate_object_key(prefix, file.filename)
+    content_type = CONTENT_TYPE_MAP[detected_ext]
 
-    object_key, _ = _generate_object_key(prefix, file.filename)
-    content_type = CONTENT_TYPE_MAP.get(ext, "application/octet-stream")
+    # Known size: validate and stream the spooled file directly, off the loop
+    if _check_upload_size(file, MAX_IMAGE_SIZE):
+        await run_in_threadpool(_validate_image_file, file.file)
+        await run_in_threadpool(
+            _upload_fileobj_to_s3, file.file, object_key, content_type
+        )
+        return object_key
 
-    _upload_bytes_to_s3(contents, object_key, content_type)
+    # Size unknown: buffer the body, then keep the PIL check and the S3 PUT
+    # off the event loop like the streaming path does
+    contents = await _read_upload(file, MAX_IMAGE_SIZE)
+    await run_in_threadpool(_validate_image_bytes, contents)
+    await run_in_threadpool(_upload_bytes_to_s3, contents, object_key, content_type)
     return object_key
 
 
@@ -313,25 +460,24 @@ async def upload_video(file: UploadFile, prefix: str = "videos") -> str:
     if not file or not file.filename:
         raise HTTPException(status_code=400, detail="No file provided")
 
-    ext = Path(file.filename).suffix.lower()
+    ext = _file_ext(file.filename)
     if ext not in ALLOWED_VIDEO_EXTENSIONS:
         raise HTTPException(
             status_code=400,
-            detail=f"File type not allowed. Allowed: {', '.join(ALLOWED_VIDEO_EXTENSIONS)}",
-        )
-
-    contents = await file.read()
-
-    if len(contents) > MAX_VIDEO_SIZE:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File too large. Maximum size: {MAX_VIDEO_SIZE // (1024 * 1024)}MB",
+            detail=_VIDEO_TYPE_ERROR,
         )
 
     object_key, _ = _generate_object_key(prefix, file.filename)
     content_type = CONTENT_TYPE_MAP.get(ext, "application/octet-stream")
 
-    _upload_bytes_to_s3(contents, object_key, content_type)
+    if _check_upload_size(file, MAX_VIDEO_SIZE):
+        await run_in_threadpool(
+            _upload_fileobj_to_s3, file.file, object_key, content_type
+        )
+        return object_key
+
+    contents = await _read_upload(file, MAX_VIDEO_SIZE)
+    await run_in_threadpool(_upload_bytes_to_s3, contents, object_key, content_type)
     return object_key
 
 
@@ -346,3 +492,13 @@ def delete_file(object_key_or_url: str) -> bool:
     if key is None:
         key = object_key_or_url  # assume it's already a raw key
     return delete_from_s3(key)
+
+
+def delete_files(object_keys_or_urls: list[str]) -> int:
+    """
+    Batch variant of ``delete_file``: one DeleteObjects call per 1000 files.
+    """
+    keys = [
+        extract_object_key_from_url(value) or value for value in object_keys_or_urls
+    ]
+    return delete_many_from_s3(keys)
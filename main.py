@@ -110,6 +110,13 @@ async def lifespan(app: FastAPI):
         Base.metadata.create_all(bind=engine)
         logger.info("✓ Database tables created successfully")
 
+        # Build deferred response schemas before serving requests
+        logger.info("Building response schemas...")
+        from app.schemas.warmup import build_response_schemas
+
+        built = build_response_schemas()
+        logger.info(f"✓ {built} response schemas built")
+
         # Start background scheduler
         logger.info("Starting background scheduler...")
         from app.core.scheduler import start_scheduler
@@ -401,6 +408,10 @@ def prod(host: str, port: int, workers: int):
     # Initialize superadmin before starting server
     create_super_admin()
 
+    # Workers size their DB pools from this (app.core.database), so it must
+    # match the --workers actually passed to gunicorn
+    os.environ["GUNICORN_WORKERS"] = str(workers)
+
     cmd = [
         "gunicorn",
         "main:app",
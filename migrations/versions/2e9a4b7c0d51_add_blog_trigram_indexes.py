@@ -0,0 +1,31 @@
+"""add blog trigram indexes
+
+Revision ID: 2e9a4b7c0d51
+Revises: c5d1f7a2e864
+Create Date: 2026-10-16 12:05:33.907416
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2e9a4b7c0d51'
+down_revision: Union[str, Sequence[str], None] = 'c5d1f7a2e864'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute('CREATE INDEX blog_title_trgm ON blogs USING gin (lower(title) gin_trgm_ops)')
+    op.execute('CREATE INDEX blog_subject_trgm ON blogs USING gin (lower(subject) gin_trgm_ops)')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('blog_subject_trgm', table_name='blogs')
+    op.drop_index('blog_title_trgm', table_name='blogs')
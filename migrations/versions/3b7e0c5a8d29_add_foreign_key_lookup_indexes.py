@@ -0,0 +1,32 @@
+"""add foreign key lookup indexes
+
+Revision ID: 3b7e0c5a8d29
+Revises: 9d4f1b6e2a73
+Create Date: 2026-10-16 14:31:52.604713
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e0c5a8d29'
+down_revision: Union[str, Sequence[str], None] = '9d4f1b6e2a73'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_course_contents_course_id'), 'course_contents', ['course_id'], unique=False)
+    op.create_index(op.f('ix_user_course_subscriptions_course_id'), 'user_course_subscriptions', ['course_id'], unique=False)
+    op.create_index(op.f('ix_coupon_user_usage_user_id'), 'coupon_user_usage', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_coupon_user_usage_user_id'), table_name='coupon_user_usage')
+    op.drop_index(op.f('ix_user_course_subscriptions_course_id'), table_name='user_course_subscriptions')
+    op.drop_index(op.f('ix_course_contents_course_id'), table_name='course_contents')
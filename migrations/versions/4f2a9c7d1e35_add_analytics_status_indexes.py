@@ -0,0 +1,34 @@
+"""add analytics status indexes
+
+Revision ID: 4f2a9c7d1e35
+Revises: d6b733139524
+Create Date: 2026-10-16 10:12:03.514221
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f2a9c7d1e35'
+down_revision: Union[str, Sequence[str], None] = 'd6b733139524'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_users_active', 'users', ['id'], unique=False, postgresql_where=sa.text('is_active = true'))
+    op.create_index('ix_users_blocked', 'users', ['id'], unique=False, postgresql_where=sa.text('is_blocked = true'))
+    op.create_index('ix_testimonials_accepted', 'testimonials', ['id'], unique=False, postgresql_where=sa.text('is_accepted = true'))
+    op.create_index(op.f('ix_invoices_status'), 'invoices', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_invoices_status'), table_name='invoices')
+    op.drop_index('ix_testimonials_accepted', table_name='testimonials', postgresql_where=sa.text('is_accepted = true'))
+    op.drop_index('ix_users_blocked', table_name='users', postgresql_where=sa.text('is_blocked = true'))
+    op.drop_index('ix_users_active', table_name='users', postgresql_where=sa.text('is_active = true'))
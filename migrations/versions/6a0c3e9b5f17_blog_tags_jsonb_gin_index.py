@@ -0,0 +1,39 @@
+"""blog tags jsonb gin index
+
+Revision ID: 6a0c3e9b5f17
+Revises: 2e9a4b7c0d51
+Create Date: 2026-10-16 13:21:08.445190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6a0c3e9b5f17'
+down_revision: Union[str, Sequence[str], None] = '2e9a4b7c0d51'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('blogs', 'tags',
+               existing_type=sa.JSON(),
+               type_=postgresql.JSONB(astext_type=sa.Text()),
+               existing_nullable=False,
+               postgresql_using='tags::jsonb')
+    op.create_index('blog_tags_gin', 'blogs', ['tags'], unique=False, postgresql_using='gin', postgresql_ops={'tags': 'jsonb_path_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('blog_tags_gin', table_name='blogs', postgresql_using='gin', postgresql_ops={'tags': 'jsonb_path_ops'})
+    op.alter_column('blogs', 'tags',
+               existing_type=postgresql.JSONB(astext_type=sa.Text()),
+               type_=sa.JSON(),
+               existing_nullable=False,
+               postgresql_using='tags::json')
@@ -0,0 +1,28 @@
+"""add gallery created_at id desc index
+
+Revision ID: 7c2d9e4f1a86
+Revises: 3b7e0c5a8d29
+Create Date: 2026-10-16 15:08:14.927350
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2d9e4f1a86'
+down_revision: Union[str, Sequence[str], None] = '3b7e0c5a8d29'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('gallery_created_at_id_desc', 'gallery', [sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('gallery_created_at_id_desc', table_name='gallery')
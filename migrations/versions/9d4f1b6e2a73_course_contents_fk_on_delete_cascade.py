@@ -0,0 +1,30 @@
+"""course contents fk on delete cascade
+
+Revision ID: 9d4f1b6e2a73
+Revises: 6a0c3e9b5f17
+Create Date: 2026-10-16 14:02:37.118406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4f1b6e2a73'
+down_revision: Union[str, Sequence[str], None] = '6a0c3e9b5f17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint('course_contents_course_id_fkey', 'course_contents', type_='foreignkey')
+    op.create_foreign_key('course_contents_course_id_fkey', 'course_contents', 'courses', ['course_id'], ['id'], ondelete='CASCADE')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('course_contents_course_id_fkey', 'course_contents', type_='foreignkey')
+    op.create_foreign_key('course_contents_course_id_fkey', 'course_contents', 'courses', ['course_id'], ['id'])
@@ -0,0 +1,28 @@
+"""add users created_at desc index
+
+Revision ID: c5d1f7a2e864
+Revises: 8b3e6d0a9f42
+Create Date: 2026-10-16 11:40:19.622057
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d1f7a2e864'
+down_revision: Union[str, Sequence[str], None] = '8b3e6d0a9f42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('users_created_at_desc', 'users', [sa.text('created_at DESC')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('users_created_at_desc', table_name='users')
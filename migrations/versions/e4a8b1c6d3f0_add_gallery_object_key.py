@@ -0,0 +1,36 @@
+"""add gallery object key
+
+Revision ID: e4a8b1c6d3f0
+Revises: 7c2d9e4f1a86
+Create Date: 2026-10-16 15:36:41.203958
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a8b1c6d3f0'
+down_revision: Union[str, Sequence[str], None] = '7c2d9e4f1a86'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('gallery', sa.Column('object_key', sa.String(length=255), nullable=True))
+    op.create_index(op.f('ix_gallery_object_key'), 'gallery', ['object_key'], unique=False)
+    # Gallery uploads are stored under the "gallery/" prefix; recover the key
+    # from the tail of the public URL
+    op.execute(
+        "UPDATE gallery SET object_key = substring(url from '(gallery/[^/]+)$') "
+        "WHERE url ~ 'gallery/[^/]+$'"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_gallery_object_key'), table_name='gallery')
+    op.drop_column('gallery', 'object_key')